@@ -2,7 +2,6 @@ from __future__ import unicode_literals
 
 import hashlib
 import json
-import time
 import warnings
 
 from django import forms
@@ -17,17 +16,17 @@ from django.contrib.auth import (
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.cache import cache
 from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.core.signals import setting_changed
 from django.http import HttpResponse, HttpResponseRedirect
 from django.shortcuts import resolve_url
 from django.template import TemplateDoesNotExist
-from django.template.loader import render_to_string
+from django.template.loader import get_template, render_to_string
 from django.urls import reverse
-from django.utils import timezone
 
 from allauth.compat import force_str, ugettext_lazy as _
 
+from .. import ratelimit
 from ..utils import (
     build_absolute_uri,
     email_address_exists,
@@ -36,6 +35,19 @@ from ..utils import (
     import_attribute,
 )
 from . import app_settings
+from .mailqueue import get_mail_queue
+
+
+# E-mail templates by template prefix, see `get_mail_templates()`.
+_mail_templates = {}
+
+
+def _clear_mail_templates(setting, **kwargs):
+    if setting in ('TEMPLATES', 'DEBUG'):
+        _mail_templates.clear()
+
+
+setting_changed.connect(_clear_mail_templates)
 
 
 class DefaultAccountAdapter(object):
@@ -99,8 +111,8 @@ class DefaultAccountAdapter(object):
         Renders an e-mail to `email`.  `template_prefix` identifies the
         e-mail that is to be sent, e.g. "account/email/email_confirmation"
         """
-        subject = render_to_string('{0}_subject.txt'.format(template_prefix),
-                                   context)
+        templates = self.get_mail_templates(template_prefix)
+        subject = templates['subject'].render(context)
         # remove superfluous line breaks
         subject = " ".join(subject.splitlines()).strip()
         subject = self.format_email_subject(subject)
@@ -109,14 +121,8 @@ class DefaultAccountAdapter(object):
 
         bodies = {}
         for ext in ['html', 'txt']:
-            try:
-                template_name = '{0}_message.{1}'.format(template_prefix, ext)
-                bodies[ext] = render_to_string(template_name,
-                                               context).strip()
-            except TemplateDoesNotExist:
-                if ext == 'txt' and not bodies:
-                    # We need at least one body
-                    raise
+            if ext in templates:
+                bodies[ext] = templates[ext].render(context).strip()
         if 'txt' in bodies:
             msg = EmailMultiAlternatives(subject,
                                          bodies['txt'],
@@ -132,9 +138,38 @@ class DefaultAccountAdapter(object):
             msg.content_subtype = 'html'  # Main content is now text/html
         return msg
 
+    def get_mail_templates(self, template_prefix):
+        """
+        Returns the (compiled) templates for the e-mail identified by
+        `template_prefix`, keyed by "subject", "txt" and "html" (for the
+        message bodies that exist). Unless `DEBUG` is on, the result is
+        cached for the lifetime of the process.
+        """
+        templates = _mail_templates.get(template_prefix)
+        if templates is None:
+            templates = {
+                'subject': get_template(
+                    '{0}_subject.txt'.format(template_prefix)),
+            }
+            for ext in ['html', 'txt']:
+                try:
+                    templates[ext] = get_template(
+                        '{0}_message.{1}'.format(template_prefix, ext))
+                except TemplateDoesNotExist:
+                    if ext == 'txt' and 'html' not in templates:
+                        # We need at least one body
+                        raise
+            if not settings.DEBUG:
+                _mail_templates[template_prefix] = templates
+        return templates
+
     def send_mail(self, template_prefix, email, context):
         msg = self.render_mail(template_prefix, email, context)
-        msg.send()
+        queue = get_mail_queue()
+        if queue is None:
+            msg.send()
+        else:
+            queue.enqueue(msg)
 
     def get_login_redirect_url(self, request):
         """
@@ -430,7 +465,7 @@ class DefaultAccountAdapter(object):
             url)
         return ret
 
-    def send_confirmation_mail(self, request, emailconfirmation, signup):
+    def _get_confirmation_mail(self, request, emailconfirmation, signup):
         current_site = get_current_site(request)
         activate_url = self.get_email_confirmation_url(
             request,
@@ -445,14 +480,32 @@ class DefaultAccountAdapter(object):
             email_template = 'account/email/email_confirmation_signup'
         else:
             email_template = 'account/email/email_confirmation'
-        self.send_mail(email_template,
-                       emailconfirmation.email_address.email,
-                       ctx)
+        return email_template, emailconfirmation.email_address.email, ctx
+
+    def render_confirmation_mail(self, request, emailconfirmation, signup):
+        """
+        Renders, but does not send, the mail `send_confirmation_mail()`
+        sends.
+        """
+        return self.render_mail(*self._get_confirmation_mail(
+            request, emailconfirmation, signup))
+
+    def send_confirmation_mail(self, request, emailconfirmation, signup):
+        self.send_mail(*self._get_confirmation_mail(
+            request, emailconfirmation, signup))
 
     def respond_user_inactive(self, request, user):
         return HttpResponseRedirect(
             reverse('account_inactive'))
 
+    def get_email_verification_state(self, request, user):
+        """
+        Returns the e-mail addresses of the user, as used to decide whether
+        or not the user needs to verify an e-mail address upon login.
+        """
+        from .models import EmailAddress
+        return EmailAddress.objects.get_verification_state(user)
+
     def respond_email_verification_sent(self, request, user):
         return HttpResponseRedirect(
             reverse('account_email_verification_sent'))
@@ -461,24 +514,36 @@ class DefaultAccountAdapter(object):
         site = get_current_site(request)
         login = credentials.get('email', credentials.get('username', ''))
         login_key = hashlib.sha256(login.encode('utf8')).hexdigest()
-        return 'allauth/login_attempts@{site_id}:{login}'.format(
+        return 'allauth/login_attempts_count@{site_id}:{login}'.format(
             site_id=site.pk,
             login=login_key)
 
-    def pre_authenticate(self, request, **credentials):
+    def _get_login_attempts_ip_cache_key(self, request):
+        site = get_current_site(request)
+        return 'allauth/login_attempts_ip_count@{site_id}:{ip}'.format(
+            site_id=site.pk,
+            ip=request.META.get('REMOTE_ADDR', ''))
+
+    def _get_login_attempts_limits(self, request, **credentials):
+        """
+        Returns the login attempt counters that apply, mapping the cache key
+        of each counter to its limit.
+        """
+        limits = {}
         if app_settings.LOGIN_ATTEMPTS_LIMIT:
             cache_key = self._get_login_attempts_cache_key(
                 request, **credentials)
-            login_data = cache.get(cache_key, None)
-            if login_data:
-                dt = timezone.now()
-                current_attempt_time = time.mktime(dt.timetuple())
-                if (len(login_data) >= app_settings.LOGIN_ATTEMPTS_LIMIT and
-                        current_attempt_time < (
-                            login_data[-1] +
-                            app_settings.LOGIN_ATTEMPTS_TIMEOUT)):
-                    raise forms.ValidationError(
-                        self.error_messages['too_many_login_attempts'])
+            limits[cache_key] = app_settings.LOGIN_ATTEMPTS_LIMIT
+        if app_settings.LOGIN_ATTEMPTS_IP_LIMIT:
+            cache_key = self._get_login_attempts_ip_cache_key(request)
+            limits[cache_key] = app_settings.LOGIN_ATTEMPTS_IP_LIMIT
+        return limits
+
+    def pre_authenticate(self, request, **credentials):
+        limits = self._get_login_attempts_limits(request, **credentials)
+        if limits and ratelimit.is_exceeded(limits):
+            raise forms.ValidationError(
+                self.error_messages['too_many_login_attempts'])
 
     def authenticate(self, request, **credentials):
         """Only authenticates, does not actually login. See `login`"""
@@ -489,23 +554,19 @@ class DefaultAccountAdapter(object):
         user = authenticate(request, **credentials)
         alt_user = AuthenticationBackend.unstash_authenticated_user()
         user = user or alt_user
-        if user and app_settings.LOGIN_ATTEMPTS_LIMIT:
-            cache_key = self._get_login_attempts_cache_key(
-                request, **credentials)
-            cache.delete(cache_key)
+        if user:
+            if app_settings.LOGIN_ATTEMPTS_LIMIT:
+                cache_key = self._get_login_attempts_cache_key(
+                    request, **credentials)
+                ratelimit.clear(cache_key)
         else:
             self.authentication_failed(request, **credentials)
         return user
 
     def authentication_failed(self, request, **credentials):
-        if app_settings.LOGIN_ATTEMPTS_LIMIT:
-            cache_key = self._get_login_attempts_cache_key(
-                request, **credentials
-            )
-            data = cache.get(cache_key, [])
-            dt = timezone.now()
-            data.append(time.mktime(dt.timetuple()))
-            cache.set(cache_key, data, app_settings.LOGIN_ATTEMPTS_TIMEOUT)
+        limits = self._get_login_attempts_limits(request, **credentials)
+        for cache_key in limits:
+            ratelimit.hit(cache_key, app_settings.LOGIN_ATTEMPTS_TIMEOUT)
 
     def is_ajax(self, request):
         return request.is_ajax()
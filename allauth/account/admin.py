@@ -2,7 +2,7 @@ from django.contrib import admin
 
 from . import app_settings
 from .adapter import get_adapter
-from .models import EmailAddress, EmailConfirmation
+from .models import EmailAddress, EmailConfirmation, QueuedEmail
 
 
 class EmailAddressAdmin(admin.ModelAdmin):
@@ -22,6 +22,13 @@ class EmailConfirmationAdmin(admin.ModelAdmin):
     raw_id_fields = ('email_address',)
 
 
+class QueuedEmailAdmin(admin.ModelAdmin):
+    list_display = ('pk', 'created', 'attempts', 'last_error')
+    list_filter = ('attempts',)
+
+
 if not app_settings.EMAIL_CONFIRMATION_HMAC:
     admin.site.register(EmailConfirmation, EmailConfirmationAdmin)
 admin.site.register(EmailAddress, EmailAddressAdmin)
+if app_settings.EMAIL_QUEUE:
+    admin.site.register(QueuedEmail, QueuedEmailAdmin)
@@ -107,6 +107,14 @@ class AppSettings(object):
                             self.AuthenticationMethod.USERNAME)
         return ret
 
+    @property
+    def AUTHENTICATION_PREFER_VERIFIED_EMAIL(self):
+        """
+        When authenticating by e-mail, only consider the user owning the
+        verified primary address, if there is one.
+        """
+        return self._setting("AUTHENTICATION_PREFER_VERIFIED_EMAIL", False)
+
     @property
     def EMAIL_MAX_LENGTH(self):
         """
@@ -121,6 +129,14 @@ class AppSettings(object):
         """
         return self._setting("UNIQUE_EMAIL", True)
 
+    @property
+    def NORMALIZED_EMAIL_LOOKUP(self):
+        """
+        Look up e-mail addresses using the (indexed) lowercased
+        `EmailAddress.email_lower` column, instead of `__iexact`.
+        """
+        return self._setting("NORMALIZED_EMAIL_LOOKUP", False)
+
     @property
     def SIGNUP_EMAIL_ENTER_TWICE(self):
         """
@@ -302,6 +318,30 @@ class AppSettings(object):
         """
         return self._setting('LOGIN_ATTEMPTS_TIMEOUT', 60 * 5)
 
+    @property
+    def LOGIN_ATTEMPTS_IP_LIMIT(self):
+        """
+        Number of failed login attempts allowed from a single IP address
+        (for any login), within `LOGIN_ATTEMPTS_TIMEOUT`. Disabled by
+        default.
+        """
+        return self._setting('LOGIN_ATTEMPTS_IP_LIMIT', None)
+
+    @property
+    def EMAIL_QUEUE(self):
+        """
+        Dotted path to the mail queue class that e-mails are handed to,
+        instead of sending them right away.
+        """
+        return self._setting('EMAIL_QUEUE', None)
+
+    @property
+    def EMAIL_QUEUE_MAX_ATTEMPTS(self):
+        """
+        Number of times sending a queued e-mail is attempted.
+        """
+        return self._setting('EMAIL_QUEUE_MAX_ATTEMPTS', 3)
+
     @property
     def EMAIL_CONFIRMATION_HMAC(self):
         return self._setting('EMAIL_CONFIRMATION_HMAC', True)
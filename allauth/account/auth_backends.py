@@ -51,7 +51,14 @@ class AuthenticationBackend(ModelBackend):
         # and use username as fallback
         email = credentials.get('email', credentials.get('username'))
         if email:
-            for user in filter_users_by_email(email):
+            # Optionally, the owner of the verified address takes
+            # precedence over users whose (unverified) User.email merely
+            # matches.
+            users = filter_users_by_email(
+                email,
+                prefer_verified=(
+                    app_settings.AUTHENTICATION_PREFER_VERIFIED_EMAIL))
+            for user in users:
                 if self._check_password(user, credentials["password"]):
                     return user
         return None
@@ -0,0 +1,262 @@
+"""
+Outbound e-mail queues, see `ACCOUNT_EMAIL_QUEUE`.
+
+A queue takes the messages rendered by `DefaultAccountAdapter.send_mail()`
+off the request/response cycle. Queued messages are sent in batches, over a
+single connection, and sending is retried up to
+`ACCOUNT_EMAIL_QUEUE_MAX_ATTEMPTS` times.
+"""
+import base64
+import json
+import logging
+import threading
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ..compat import Empty, Queue, force_str
+from ..utils import import_attribute
+from . import app_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def serialize_attachment(attachment):
+    """
+    Serializes an attachment added by `EmailMessage.attach()`. Only
+    `(filename, content, mimetype)` attachments can be serialized.
+    """
+    if not isinstance(attachment, (list, tuple)):
+        raise ValueError('Unable to queue e-mail with a MIME attachment')
+    filename, content, mimetype = attachment
+    if isinstance(content, bytes):
+        content = {'base64': force_str(base64.b64encode(content))}
+    else:
+        content = {'text': content}
+    return [filename, content, mimetype]
+
+
+def deserialize_attachment(data):
+    filename, content, mimetype = data
+    if 'base64' in content:
+        content = base64.b64decode(content['base64'])
+    else:
+        content = content['text']
+    return (filename, content, mimetype)
+
+
+def serialize_message(msg):
+    return json.dumps({
+        'subject': msg.subject,
+        'body': msg.body,
+        'from_email': msg.from_email,
+        'to': msg.to,
+        'cc': msg.cc,
+        'bcc': msg.bcc,
+        'reply_to': msg.reply_to,
+        'headers': msg.extra_headers,
+        'alternatives': getattr(msg, 'alternatives', []),
+        'attachments': [serialize_attachment(attachment)
+                        for attachment in msg.attachments],
+        'content_subtype': msg.content_subtype,
+    })
+
+
+def deserialize_message(data):
+    data = json.loads(data)
+    content_subtype = data.pop('content_subtype')
+    data['alternatives'] = [tuple(alt) for alt in data['alternatives']]
+    data['attachments'] = [deserialize_attachment(attachment)
+                           for attachment in data.get('attachments', [])]
+    msg = EmailMultiAlternatives(**data)
+    msg.content_subtype = content_subtype
+    return msg
+
+
+def send_messages(messages):
+    """
+    Sends `messages` over a single connection. Returns, for each message,
+    the exception raised when sending it, or `None` if it was sent.
+    """
+    mail_connection = get_connection()
+    try:
+        mail_connection.open()
+    except Exception as e:
+        return [e] * len(messages)
+    errors = []
+    try:
+        for msg in messages:
+            try:
+                mail_connection.send_messages([msg])
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+    finally:
+        mail_connection.close()
+    return errors
+
+
+class BaseMailQueue(object):
+
+    def enqueue(self, msg):
+        raise NotImplementedError
+
+
+class ThreadMailQueue(BaseMailQueue):
+    """
+    Sends the messages from a background thread, once the current
+    transaction (if any) commits. Note that messages still queued when the
+    process exits are lost.
+    """
+    batch_size = 50
+    retry_delay = 30
+
+    def __init__(self):
+        self.queue = Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def enqueue(self, msg):
+        transaction.on_commit(lambda: self.put(msg, 0))
+
+    def put(self, msg, attempts):
+        self.queue.put((msg, attempts))
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run,
+                    name='allauth-mail-queue')
+                self.thread.daemon = True
+                self.thread.start()
+
+    def join(self):
+        """
+        Blocks until all queued messages have been processed.
+        """
+        self.queue.join()
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except Empty:
+                    break
+            try:
+                self.send_batch(batch)
+            finally:
+                for item in batch:
+                    self.queue.task_done()
+
+    def send_batch(self, batch):
+        errors = send_messages([msg for msg, attempts in batch])
+        for (msg, attempts), error in zip(batch, errors):
+            if error is None:
+                continue
+            attempts += 1
+            if attempts >= app_settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+                logger.error('Failed to send e-mail to %s: %s',
+                             ', '.join(msg.recipients()), error)
+                continue
+            timer = threading.Timer(
+                self.retry_delay * attempts, self.put, (msg, attempts))
+            timer.daemon = True
+            timer.start()
+
+
+class OutboxMailQueue(BaseMailQueue):
+    """
+    Stores the messages in the database (`QueuedEmail`), as part of the
+    current transaction. The messages are sent by the
+    `account_send_queued_email` management command.
+    """
+    claim_timeout = 600
+
+    def enqueue(self, msg):
+        from .models import QueuedEmail
+        QueuedEmail.objects.create(message=serialize_message(msg))
+
+    def drain(self, batch_size=100):
+        """
+        Sends the queued messages. Returns the number of messages sent and
+        the number of messages that failed to send.
+        """
+        sent = failed = 0
+        last_pk = 0
+        while True:
+            batch = self.claim(batch_size, last_pk)
+            if not batch:
+                break
+            # Sending happens outside of any transaction, so that no row
+            # locks are held while talking to the mail server.
+            errors = send_messages(
+                [deserialize_message(q.message) for q in batch])
+            self.release(batch, errors)
+            failed += len([error for error in errors if error is not None])
+            sent += len([error for error in errors if error is None])
+            last_pk = batch[-1].pk
+        return sent, failed
+
+    def claim(self, batch_size, last_pk=0):
+        """
+        Claims up to `batch_size` queued messages (counting the attempt to
+        send them), so that concurrent drains skip them. Claims older than
+        `claim_timeout` seconds, left behind by a drain that died while
+        sending, expire.
+        """
+        from .models import QueuedEmail
+        now = timezone.now()
+        expired = now - timedelta(seconds=self.claim_timeout)
+        with transaction.atomic():
+            queued = QueuedEmail.objects.filter(
+                Q(claimed__isnull=True) | Q(claimed__lt=expired),
+                pk__gt=last_pk,
+                attempts__lt=app_settings.EMAIL_QUEUE_MAX_ATTEMPTS
+            ).order_by('pk')
+            if connection.features.has_select_for_update_skip_locked:
+                queued = queued.select_for_update(skip_locked=True)
+            elif connection.features.has_select_for_update:
+                queued = queued.select_for_update()
+            batch = list(queued[:batch_size])
+            QueuedEmail.objects.filter(
+                pk__in=[q.pk for q in batch]
+            ).update(claimed=now, attempts=F('attempts') + 1)
+        return batch
+
+    def release(self, batch, errors):
+        """
+        Removes the messages that were sent, and records the error for the
+        ones that were not, making them available for a retry.
+        """
+        from .models import QueuedEmail
+        with transaction.atomic():
+            for queued_email, error in zip(batch, errors):
+                if error is None:
+                    continue
+                QueuedEmail.objects.filter(pk=queued_email.pk).update(
+                    claimed=None, last_error=force_str(error))
+            QueuedEmail.objects.filter(
+                pk__in=[q.pk for q, error in zip(batch, errors)
+                        if error is None]).delete()
+
+
+_queues = {}
+
+
+def get_mail_queue():
+    """
+    Returns the (process wide) mail queue configured by
+    `ACCOUNT_EMAIL_QUEUE`, or `None`.
+    """
+    path = app_settings.EMAIL_QUEUE
+    if not path:
+        return None
+    queue = _queues.get(path)
+    if queue is None:
+        queue = _queues.setdefault(path, import_attribute(path)())
+    return queue
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from allauth.account.models import EmailAddress
+
+
+class Command(BaseCommand):
+    help = ('Fills in the normalized e-mail address of existing'
+            ' e-mail addresses, see ACCOUNT_NORMALIZED_EMAIL_LOOKUP.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        total = 0
+        last_pk = None
+        addresses = EmailAddress.objects.filter(
+            email_lower__isnull=True).only('pk', 'email').order_by('pk')
+        while True:
+            if last_pk is not None:
+                batch = addresses.filter(pk__gt=last_pk)
+            else:
+                batch = addresses
+            batch = list(batch[:batch_size])
+            if not batch:
+                break
+            self.update_batch(batch)
+            last_pk = batch[-1].pk
+            total += len(batch)
+        self.stdout.write('Updated %d e-mail addresses.' % total)
+
+    def update_batch(self, batch):
+        for address in batch:
+            address.email_lower = address.email.lower()
+        if hasattr(EmailAddress.objects, 'bulk_update'):
+            EmailAddress.objects.bulk_update(batch, ['email_lower'])
+        else:
+            with transaction.atomic():
+                for address in batch:
+                    EmailAddress.objects.filter(pk=address.pk).update(
+                        email_lower=address.email_lower)
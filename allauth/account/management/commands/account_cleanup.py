@@ -0,0 +1,46 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from allauth.account.models import EmailConfirmation
+from allauth.utils import delete_in_batches
+
+
+class Command(BaseCommand):
+    help = ('Deletes expired e-mail confirmations and, if the OpenID'
+            ' provider is installed, stale OpenID nonces and expired'
+            ' associations, in batches.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--sleep', type=float, default=0,
+            help='Seconds to sleep in between batches.')
+
+    def handle(self, *args, **options):
+        for name, queryset in self.get_querysets():
+            start = time.time()
+            deleted = delete_in_batches(
+                queryset,
+                batch_size=options['batch_size'],
+                sleep=options['sleep'])
+            self.stdout.write('%s: deleted %d rows in %.1fs' % (
+                name, deleted, time.time() - start))
+
+    def get_querysets(self):
+        yield ('EmailConfirmation', EmailConfirmation.objects.all_expired())
+        if apps.is_installed('allauth.socialaccount.providers.openid'):
+            from allauth.socialaccount.providers.openid.models import (
+                OpenIDNonce,
+                OpenIDStore,
+            )
+            from allauth.socialaccount.providers.openid.utils import (
+                DBOpenIDStore,
+            )
+            now = int(time.time())
+            yield ('OpenIDNonce', OpenIDNonce.objects.filter(
+                timestamp__lt=now - DBOpenIDStore.max_nonce_age))
+            yield ('OpenIDStore', OpenIDStore.objects.filter(
+                issued__lt=now - F('lifetime')))
@@ -0,0 +1,112 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from allauth.account import app_settings, signals
+from allauth.account.adapter import get_adapter
+from allauth.account.mailqueue import send_messages
+from allauth.account.models import (
+    EmailAddress,
+    EmailConfirmation,
+    EmailConfirmationHMAC,
+)
+
+
+class Command(BaseCommand):
+    help = ('Sends a confirmation mail to all unverified e-mail addresses,'
+            ' skipping the ones a confirmation was sent to within'
+            ' ACCOUNT_EMAIL_CONFIRMATION_COOLDOWN.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        addresses = self.get_email_addresses()
+        total = addresses.count()
+        sent = failed = 0
+        start = time.time()
+        batch = []
+        for address in addresses.iterator():
+            batch.append(address)
+            if len(batch) < batch_size:
+                continue
+            batch_sent = self.send_batch(batch)
+            sent += batch_sent
+            failed += len(batch) - batch_sent
+            batch = []
+            self.report(sent, failed, total, start)
+        if batch:
+            batch_sent = self.send_batch(batch)
+            sent += batch_sent
+            failed += len(batch) - batch_sent
+        self.report(sent, failed, total, start)
+
+    def get_email_addresses(self):
+        addresses = EmailAddress.objects.filter(
+            verified=False).select_related('user').order_by('pk')
+        if not app_settings.EMAIL_CONFIRMATION_HMAC:
+            cooldown_period = timedelta(
+                seconds=app_settings.EMAIL_CONFIRMATION_COOLDOWN)
+            addresses = addresses.exclude(
+                emailconfirmation__sent__gt=timezone.now() - cooldown_period)
+        return addresses
+
+    def send_batch(self, batch):
+        """
+        Sends the confirmation mails for `batch` over a single connection.
+        Returns the number of mails sent.
+        """
+        adapter = get_adapter()
+        if app_settings.EMAIL_CONFIRMATION_HMAC:
+            confirmations = [
+                EmailConfirmationHMAC(address) for address in batch]
+        else:
+            now = timezone.now()
+            confirmations = EmailConfirmation.objects.bulk_create([
+                EmailConfirmation(email_address=address,
+                                  key=get_random_string(64).lower(),
+                                  created=now,
+                                  sent=now)
+                for address in batch])
+            if any(confirmation.pk is None for confirmation in confirmations):
+                # Only some databases hand back the primary keys of bulk
+                # inserted rows: read the rows back, so that the signal
+                # receivers get saved instances.
+                saved = dict(
+                    (confirmation.key, confirmation)
+                    for confirmation in EmailConfirmation.objects.filter(
+                        key__in=[c.key for c in confirmations]
+                    ).select_related('email_address__user'))
+                confirmations = [saved[confirmation.key]
+                                 for confirmation in confirmations]
+        errors = send_messages([
+            adapter.render_confirmation_mail(None, confirmation, False)
+            for confirmation in confirmations])
+        sent_confirmations = []
+        failed_keys = []
+        for confirmation, error in zip(confirmations, errors):
+            if error is None:
+                sent_confirmations.append(confirmation)
+            else:
+                failed_keys.append(confirmation.key)
+                self.stderr.write('Failed to send to %s: %s' % (
+                    confirmation.email_address.email, error))
+        if failed_keys and not app_settings.EMAIL_CONFIRMATION_HMAC:
+            EmailConfirmation.objects.filter(key__in=failed_keys).delete()
+        for confirmation in sent_confirmations:
+            signals.email_confirmation_sent.send(
+                sender=confirmation.__class__,
+                request=None,
+                confirmation=confirmation,
+                signup=False)
+        return len(sent_confirmations)
+
+    def report(self, sent, failed, total, start):
+        elapsed = time.time() - start
+        rate = sent / elapsed if elapsed else 0
+        self.stdout.write('%d/%d sent, %d failed (%.1f mails/s)' % (
+            sent, total, failed, rate))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from allauth.account.mailqueue import OutboxMailQueue
+
+
+class Command(BaseCommand):
+    help = 'Sends the e-mails queued by the OutboxMailQueue.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+
+    def handle(self, *args, **options):
+        sent, failed = OutboxMailQueue().drain(
+            batch_size=options['batch_size'])
+        self.stdout.write('Sent %d e-mails, %d failed.' % (sent, failed))
@@ -1,18 +1,56 @@
+import functools
+import operator
 from datetime import timedelta
 
-from django.db import models
-from django.db.models import Q
+from django.db import models, router
+from django.db.models import Max, Q
 from django.utils import timezone
 
 from . import app_settings
 
 
+class EmailVerificationState(object):
+    """
+    The e-mail addresses of a user, as needed to decide on e-mail
+    verification during login. Each address carries the time the last
+    confirmation for it was sent (`last_confirmation_sent`).
+    """
+    def __init__(self, addresses):
+        self.addresses = addresses
+
+    @property
+    def has_verified_email(self):
+        return any(address.verified for address in self.addresses)
+
+    @property
+    def primary(self):
+        for address in self.addresses:
+            if address.primary:
+                return address
+        return None
+
+    def get_address(self, email):
+        for address in self.addresses:
+            if address.email.lower() == email.lower():
+                return address
+        return None
+
+
 class EmailAddressManager(models.Manager):
 
+    def email_lookup(self, email):
+        """
+        Returns the lookup arguments used to (case insensitively) find
+        `email`.
+        """
+        if app_settings.NORMALIZED_EMAIL_LOOKUP:
+            return {'email_lower': email.lower()}
+        return {'email__iexact': email}
+
     def add_email(self, request, user, email,
                   confirm=False, signup=False):
         email_address, created = self.get_or_create(
-            user=user, email__iexact=email, defaults={"email": email}
+            user=user, defaults={"email": email}, **self.email_lookup(email)
         )
 
         if created and confirm:
@@ -29,8 +67,51 @@ class EmailAddressManager(models.Manager):
     def get_users_for(self, email):
         # this is a list rather than a generator because we probably want to
         # do a len() on it right away
-        return [address.user for address in self.filter(verified=True,
-                                                        email__iexact=email)]
+        return [address.user for address in self.filter(
+            verified=True, **self.email_lookup(email))]
+
+    def get_existing_emails(self, emails):
+        """
+        Returns the set of (lowercased) e-mail addresses out of `emails`
+        that are already in use, using a single query.
+        """
+        emails = set(email.lower() for email in emails)
+        if not emails:
+            return set()
+        if app_settings.NORMALIZED_EMAIL_LOOKUP:
+            q = Q(email_lower__in=emails)
+        else:
+            q = functools.reduce(
+                operator.or_,
+                [Q(email__iexact=email) for email in emails])
+        return set(
+            email.lower()
+            for email in self.filter(q).values_list('email', flat=True))
+
+    def add_for_user(self, user, addresses):
+        """
+        Saves the (new) `addresses` for `user`, in bulk. Returns the saved
+        instances, in the same order.
+        """
+        for address in addresses:
+            address.user = user
+            address.email_lower = address.email.lower()
+        if len(addresses) == 1:
+            addresses[0].save()
+            return addresses
+        self.bulk_create(addresses)
+        if any(address.pk is None for address in addresses):
+            # Not all databases return the primary keys of bulk inserted
+            # rows, read them back from the database written to.
+            db = router.db_for_write(self.model)
+            saved = dict(
+                (address.email.lower(), address)
+                for address in self.using(db).filter(user=user))
+            addresses = [saved[address.email.lower()]
+                         for address in addresses]
+            for address in addresses:
+                address.user = user
+        return addresses
 
     def fill_cache_for_user(self, user, addresses):
         """
@@ -41,12 +122,28 @@ class EmailAddressManager(models.Manager):
         """
         user._emailaddress_cache = addresses
 
+    def get_verification_state(self, user):
+        """
+        Returns the `EmailVerificationState` of `user`, using a single
+        query.
+        """
+        addresses = getattr(user, '_emailaddress_cache', None)
+        if addresses is not None:
+            # Just signed up, no confirmations have been sent yet.
+            for address in addresses:
+                address.last_confirmation_sent = None
+        else:
+            addresses = list(self.filter(user=user).annotate(
+                last_confirmation_sent=Max('emailconfirmation__sent')))
+            for address in addresses:
+                address.user = user
+        return EmailVerificationState(addresses)
+
     def get_for_user(self, user, email):
         cache_key = '_emailaddress_cache'
         addresses = getattr(user, cache_key, None)
         if addresses is None:
-            ret = self.get(user=user,
-                           email__iexact=email)
+            ret = self.get(user=user, **self.email_lookup(email))
             # To avoid additional lookups when e.g.
             # EmailAddress.set_as_primary() starts touching self.user
             ret.user = user
@@ -71,5 +168,14 @@ class EmailConfirmationManager(models.Manager):
             - timedelta(days=app_settings.EMAIL_CONFIRMATION_EXPIRE_DAYS)
         return Q(sent__lt=sent_threshold)
 
-    def delete_expired_confirmations(self):
-        self.all_expired().delete()
+    def delete_expired_confirmations(self, batch_size=None, sleep=0):
+        """
+        Deletes the expired confirmations. Pass `batch_size` to delete them
+        in batches, see `allauth.utils.delete_in_batches()`. Returns the
+        number of confirmations deleted.
+        """
+        if batch_size:
+            from ..utils import delete_in_batches
+            return delete_in_batches(
+                self.all_expired(), batch_size=batch_size, sleep=sleep)
+        return self.all_expired().delete()[0]
@@ -25,6 +25,11 @@ class EmailAddress(models.Model):
     email = models.EmailField(unique=app_settings.UNIQUE_EMAIL,
                               max_length=app_settings.EMAIL_MAX_LENGTH,
                               verbose_name=_('e-mail address'))
+    email_lower = models.CharField(max_length=app_settings.EMAIL_MAX_LENGTH,
+                                   null=True,
+                                   db_index=True,
+                                   editable=False,
+                                   verbose_name=_('normalized e-mail address'))
     verified = models.BooleanField(verbose_name=_('verified'), default=False)
     primary = models.BooleanField(verbose_name=_('primary'), default=False)
 
@@ -39,6 +44,13 @@ class EmailAddress(models.Model):
     def __str__(self):
         return "%s (%s)" % (self.email, self.user)
 
+    def save(self, *args, **kwargs):
+        self.email_lower = self.email.lower()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'email' in update_fields:
+            kwargs['update_fields'] = list(update_fields) + ['email_lower']
+        super(EmailAddress, self).save(*args, **kwargs)
+
     def set_as_primary(self, conditional=False):
         old_primary = EmailAddress.objects.get_primary(self.user)
         if old_primary:
@@ -168,3 +180,25 @@ class EmailConfirmationHMAC:
                                              request=request,
                                              confirmation=self,
                                              signup=signup)
+
+
+@python_2_unicode_compatible
+class QueuedEmail(models.Model):
+    """
+    An e-mail waiting to be sent, see `OutboxMailQueue`.
+    """
+    created = models.DateTimeField(verbose_name=_('created'),
+                                   default=timezone.now)
+    message = models.TextField(verbose_name=_('message'))
+    attempts = models.PositiveSmallIntegerField(verbose_name=_('attempts'),
+                                                default=0)
+    last_error = models.TextField(verbose_name=_('last error'), blank=True)
+    claimed = models.DateTimeField(verbose_name=_('claimed'),
+                                   null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("queued email")
+        verbose_name_plural = _("queued emails")
+
+    def __str__(self):
+        return "queued email %s" % self.pk
@@ -1,8 +1,10 @@
 from __future__ import absolute_import
 
 import json
+import time
 import uuid
 from datetime import timedelta
+from email.mime.text import MIMEText
 
 from django import forms
 from django.conf import settings
@@ -10,6 +12,8 @@ from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.contrib.sites.models import Site
 from django.core import mail, validators
 from django.core.exceptions import ValidationError
+from django.core.mail import EmailMultiAlternatives
+from django.core.management import call_command
 from django.db import models
 from django.http import HttpResponseRedirect
 from django.template import Context, Template
@@ -19,10 +23,12 @@ from django.urls import reverse
 from django.utils.timezone import now
 
 from allauth.account.forms import BaseSignupForm, SignupForm
+from allauth.account.mailqueue import OutboxMailQueue, ThreadMailQueue
 from allauth.account.models import (
     EmailAddress,
     EmailConfirmation,
     EmailConfirmationHMAC,
+    QueuedEmail,
 )
 from allauth.tests import Mock, TestCase, patch
 from allauth.utils import get_user_model, get_username_max_length
@@ -30,9 +36,12 @@ from allauth.utils import get_user_model, get_username_max_length
 from . import app_settings
 from .adapter import get_adapter
 from .auth_backends import AuthenticationBackend
-from .signals import user_logged_in, user_logged_out
+from .signals import email_confirmation_sent, user_logged_in, user_logged_out
 from .utils import (
+    filter_users_by_email,
     filter_users_by_username,
+    send_email_confirmation,
+    setup_user_email,
     url_str_to_user_pk,
     user_pk_to_url_str,
     user_username,
@@ -536,6 +545,29 @@ class AccountTests(TestCase):
                 else
                 'The username and/or password you specified are not correct.')
 
+    @override_settings(
+        ACCOUNT_EMAIL_VERIFICATION=app_settings.EmailVerificationMethod.NONE,
+        ACCOUNT_LOGIN_ATTEMPTS_LIMIT=None,
+        ACCOUNT_LOGIN_ATTEMPTS_IP_LIMIT=3)
+    def test_login_failed_attempts_exceeded_per_ip(self):
+        user = get_user_model().objects.create(username='john')
+        user.set_password('doe')
+        user.save()
+        for i in range(4):
+            resp = self.client.post(
+                reverse('account_login'),
+                {'login': 'john%d' % i, 'password': 'wrong'},
+                REMOTE_ADDR='10.0.0.1')
+        self.assertFormError(
+            resp, 'form', None,
+            'Too many failed login attempts. Try again later.')
+        resp = self.client.post(
+            reverse('account_login'),
+            {'login': 'john', 'password': 'doe'},
+            REMOTE_ADDR='10.0.0.2')
+        self.assertRedirects(resp, settings.LOGIN_REDIRECT_URL,
+                             fetch_redirect_response=False)
+
     def test_login_unverified_account_mandatory(self):
         """Tests login behavior when email verification is mandatory."""
         user = get_user_model().objects.create(username='john')
@@ -1084,6 +1116,47 @@ class AuthenticationBackendTests(TestCase):
                 password=user.username).pk,
             user.pk)
 
+    def _create_verified_owner(self):
+        # Verified owner of the address the user's User.email matches.
+        owner = get_user_model().objects.create(
+            email='JOHN@example.com', username='owner')
+        owner.set_password('owner')
+        owner.save()
+        EmailAddress.objects.create(
+            user=owner, email='john@example.com', verified=True,
+            primary=True)
+
+    @override_settings(
+        ACCOUNT_AUTHENTICATION_METHOD=app_settings.AuthenticationMethod.EMAIL)  # noqa
+    def test_auth_by_email_unverified_match(self):
+        self._create_verified_owner()
+        backend = AuthenticationBackend()
+        self.assertEqual(
+            backend.authenticate(
+                request=None,
+                username='john@example.com',
+                password='john').pk,
+            self.user.pk)
+
+    @override_settings(
+        ACCOUNT_AUTHENTICATION_METHOD=app_settings.AuthenticationMethod.EMAIL,  # noqa
+        ACCOUNT_AUTHENTICATION_PREFER_VERIFIED_EMAIL=True)
+    def test_auth_by_email_prefer_verified(self):
+        self._create_verified_owner()
+        backend = AuthenticationBackend()
+        self.assertEqual(
+            backend.authenticate(
+                request=None,
+                username='john@example.com',
+                password='john'),
+            None)
+        self.assertEqual(
+            backend.authenticate(
+                request=None,
+                username='john@example.com',
+                password='owner').username,
+            'owner')
+
 
 class UUIDUser(AbstractUser):
     id = models.UUIDField(
@@ -1127,6 +1200,90 @@ class UtilsTests(TestCase):
         # TODO: Actually test something
         filter_users_by_username('camelcase', 'foobar')
 
+    @override_settings(ACCOUNT_UNIQUE_EMAIL=True)
+    def test_setup_user_email_bulk(self):
+        other = get_user_model().objects.create(username='other')
+        EmailAddress.objects.create(user=other, email='taken@example.com')
+        user = get_user_model().objects.create(
+            username='john', email='john@example.com')
+        request = RequestFactory().get('/')
+        request.session = {}
+        addresses = [
+            EmailAddress(email='Taken@example.com', verified=True),
+            EmailAddress(email='john2@example.com', verified=True),
+        ]
+        # The primary address changed, so the user is saved as well.
+        with self.assertNumQueries(5):
+            primary = setup_user_email(request, user, addresses)
+        self.assertEqual(primary.email, 'john2@example.com')
+        self.assertIsNotNone(primary.pk)
+        self.assertEqual(
+            sorted(EmailAddress.objects.filter(user=user).values_list(
+                'email', 'primary')),
+            [('john2@example.com', True), ('john@example.com', False)])
+        self.assertIs(
+            EmailAddress.objects.get_for_user(user, 'john@example.com').user,
+            user)
+
+    @override_settings(ACCOUNT_EMAIL_CONFIRMATION_HMAC=False)
+    def test_email_verification_state(self):
+        user = get_user_model().objects.create(
+            username='john', email='john@example.com')
+        email_address = EmailAddress.objects.create(
+            user=user, email='john@example.com', primary=True)
+        EmailAddress.objects.create(user=user, email='john2@example.com')
+        confirmation = EmailConfirmation.create(email_address)
+        confirmation.sent = now()
+        confirmation.save()
+        with self.assertNumQueries(1):
+            state = EmailAddress.objects.get_verification_state(user)
+        self.assertFalse(state.has_verified_email)
+        self.assertEqual(state.primary, email_address)
+        self.assertEqual(state.primary.last_confirmation_sent,
+                         confirmation.sent)
+        self.assertIsNone(
+            state.get_address('john2@example.com').last_confirmation_sent)
+        # Within the cooldown period, nothing is sent nor queried.
+        with self.assertNumQueries(0):
+            send_email_confirmation(RequestFactory().get('/'), user,
+                                    verification_state=state)
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(ACCOUNT_NORMALIZED_EMAIL_LOOKUP=True)
+    def test_normalized_email_lookup(self):
+        user = get_user_model().objects.create(username='john')
+        EmailAddress.objects.create(
+            user=user, email='John@Example.com', verified=True)
+        self.assertEqual(
+            EmailAddress.objects.get_users_for('JOHN@example.COM'), [user])
+        self.assertEqual(filter_users_by_email('john@example.com'), [user])
+        self.assertEqual(
+            EmailAddress.objects.get_existing_emails(['JOHN@example.com']),
+            set(['john@example.com']))
+
+    def test_filter_users_by_email(self):
+        User = get_user_model()
+        john = User.objects.create(username='john', email='john@example.com')
+        EmailAddress.objects.create(
+            user=john, email='john@example.com', verified=True, primary=True)
+        stale = User.objects.create(username='stale', email='John@example.com')
+        with self.assertNumQueries(1):
+            users = filter_users_by_email('john@example.com')
+        self.assertEqual(sorted(u.pk for u in users), [john.pk, stale.pk])
+        with self.assertNumQueries(1):
+            users = filter_users_by_email(
+                'john@example.com', prefer_verified=True)
+        self.assertEqual(users, [john])
+
+    def test_backfill_email_lower(self):
+        user = get_user_model().objects.create(username='john')
+        address = EmailAddress.objects.create(
+            user=user, email='John@Example.com')
+        EmailAddress.objects.filter(pk=address.pk).update(email_lower=None)
+        call_command('account_backfill_email_lower', stdout=Mock())
+        address.refresh_from_db()
+        self.assertEqual(address.email_lower, 'john@example.com')
+
     def test_user_display(self):
         user = get_user_model()(username='john<br/>doe')
         expected_name = 'john&lt;br/&gt;doe'
@@ -1140,6 +1297,191 @@ class UtilsTests(TestCase):
             self.assertEqual(content, expected_name)
 
 
+class MailTemplateTests(TestCase):
+
+    def test_templates_cached(self):
+        from django.template.loader import get_template
+        from .adapter import _mail_templates
+        _mail_templates.clear()
+        prefix = 'account/email/password_reset_key'
+        adapter = get_adapter()
+        with patch('allauth.account.adapter.get_template',
+                   wraps=get_template) as get_template_mock:
+            for i in range(2):
+                msg = adapter.render_mail(
+                    prefix, 'to@example.com',
+                    {'password_reset_url': 'https://example.com/reset/'})
+                self.assertIn('https://example.com/reset/', msg.body)
+        # Subject and message, the missing HTML variant is looked up once.
+        self.assertEqual(get_template_mock.call_count, 3)
+
+
+class ResendConfirmationsTests(TestCase):
+
+    def setUp(self):
+        User = get_user_model()
+        for i in range(3):
+            user = User.objects.create(username='user%d' % i)
+            EmailAddress.objects.create(
+                user=user, email='user%d@example.com' % i)
+        EmailAddress.objects.create(
+            user=user, email='verified@example.com', verified=True)
+
+    def test_resend_hmac(self):
+        call_command('account_resend_confirmations', batch_size=2,
+                     stdout=Mock())
+        self.assertEqual(
+            sorted(m.to[0] for m in mail.outbox),
+            ['user0@example.com', 'user1@example.com', 'user2@example.com'])
+
+    @override_settings(ACCOUNT_EMAIL_CONFIRMATION_HMAC=False)
+    def test_resend_respects_cooldown(self):
+        confirmation = EmailConfirmation.create(
+            EmailAddress.objects.get(email='user0@example.com'))
+        confirmation.sent = now()
+        confirmation.save()
+        call_command('account_resend_confirmations', batch_size=2,
+                     stdout=Mock())
+        self.assertEqual(
+            sorted(m.to[0] for m in mail.outbox),
+            ['user1@example.com', 'user2@example.com'])
+        for msg in mail.outbox:
+            confirmation = EmailConfirmation.objects.get(
+                email_address__email=msg.to[0])
+            self.assertIn(confirmation.key, msg.body)
+
+    @override_settings(ACCOUNT_EMAIL_CONFIRMATION_HMAC=False)
+    def test_resend_signals_saved_confirmations(self):
+        receiver = Mock()
+        email_confirmation_sent.connect(receiver)
+        try:
+            call_command('account_resend_confirmations', batch_size=2,
+                         stdout=Mock())
+        finally:
+            email_confirmation_sent.disconnect(receiver)
+        self.assertEqual(receiver.call_count, 3)
+        for call in receiver.call_args_list:
+            confirmation = call[1]['confirmation']
+            self.assertIsNotNone(confirmation.pk)
+            self.assertEqual(
+                EmailConfirmation.objects.get(pk=confirmation.pk).key,
+                confirmation.key)
+
+
+class CleanupTests(TestCase):
+
+    def test_cleanup(self):
+        from allauth.socialaccount.providers.openid.models import (
+            OpenIDNonce,
+            OpenIDStore,
+        )
+        user = get_user_model().objects.create(username='john')
+        email_address = EmailAddress.objects.create(
+            user=user, email='john@example.com')
+        for days in (0, 10, 20):
+            EmailConfirmation.objects.create(
+                email_address=email_address,
+                key='key%d' % days,
+                sent=now() - timedelta(days=days))
+        timestamp = int(time.time())
+        for age in (0, 7 * 60 * 60):
+            OpenIDNonce.objects.create(
+                server_url='https://example.com', salt='salt',
+                timestamp=timestamp - age)
+            OpenIDStore.objects.create(
+                server_url='https://example.com', handle='handle',
+                secret='secret', issued=timestamp - age, lifetime=3600,
+                assoc_type='HMAC-SHA1')
+        call_command('account_cleanup', batch_size=1, stdout=Mock())
+        self.assertEqual(
+            list(EmailConfirmation.objects.values_list('key', flat=True)),
+            ['key0'])
+        self.assertEqual(
+            list(OpenIDNonce.objects.values_list('timestamp', flat=True)),
+            [timestamp])
+        self.assertEqual(
+            list(OpenIDStore.objects.values_list('issued', flat=True)),
+            [timestamp])
+
+
+class MailQueueTests(TestCase):
+
+    def setUp(self):
+        self.msg = EmailMultiAlternatives(
+            'Subject', 'Body', 'from@example.com', ['to@example.com'])
+        self.msg.attach_alternative('<p>Body</p>', 'text/html')
+
+    @override_settings(
+        ACCOUNT_EMAIL_QUEUE='allauth.account.mailqueue.OutboxMailQueue')
+    def test_outbox(self):
+        get_adapter().send_mail(
+            'account/email/password_reset_key', 'to@example.com',
+            {'password_reset_url': 'https://example.com/reset/'})
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(QueuedEmail.objects.count(), 1)
+        call_command('account_send_queued_email', stdout=Mock())
+        self.assertEqual(QueuedEmail.objects.count(), 0)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['to@example.com'])
+        self.assertIn('https://example.com/reset/', mail.outbox[0].body)
+
+    @override_settings(ACCOUNT_EMAIL_QUEUE_MAX_ATTEMPTS=2)
+    def test_outbox_retries(self):
+        queue = OutboxMailQueue()
+        queue.enqueue(self.msg)
+        with patch('django.core.mail.backends.locmem.EmailBackend'
+                   '.send_messages') as send_messages:
+            send_messages.side_effect = Exception('Connection refused')
+            self.assertEqual(queue.drain(), (0, 1))
+            self.assertEqual(queue.drain(), (0, 1))
+            self.assertEqual(queue.drain(), (0, 0))
+        queued_email = QueuedEmail.objects.get()
+        self.assertEqual(queued_email.attempts, 2)
+        self.assertEqual(queued_email.last_error, 'Connection refused')
+        self.assertIsNone(queued_email.claimed)
+
+    def test_outbox_claimed(self):
+        queue = OutboxMailQueue()
+        queue.enqueue(self.msg)
+        self.assertEqual(len(queue.claim(10)), 1)
+        # Claimed by another drain, that is still sending it.
+        self.assertEqual(queue.drain(), (0, 0))
+        queued_email = QueuedEmail.objects.get()
+        self.assertEqual(queued_email.attempts, 1)
+        # ... until that drain is presumed dead.
+        queued_email.claimed = now() - timedelta(
+            seconds=queue.claim_timeout + 1)
+        queued_email.save()
+        self.assertEqual(queue.drain(), (1, 0))
+        self.assertEqual(QueuedEmail.objects.count(), 0)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_outbox_attachments(self):
+        self.msg.attach('notes.txt', 'Notes', 'text/plain')
+        self.msg.attach('logo.png', b'\x89PNG\r\n\x1a\n', 'image/png')
+        queue = OutboxMailQueue()
+        queue.enqueue(self.msg)
+        self.assertEqual(queue.drain(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].attachments, [
+            ('notes.txt', 'Notes', 'text/plain'),
+            ('logo.png', b'\x89PNG\r\n\x1a\n', 'image/png')])
+
+    def test_outbox_mime_attachment(self):
+        self.msg.attach(MIMEText('Notes'))
+        with self.assertRaises(ValueError):
+            OutboxMailQueue().enqueue(self.msg)
+        self.assertEqual(QueuedEmail.objects.count(), 0)
+
+    def test_thread_queue(self):
+        queue = ThreadMailQueue()
+        queue.put(self.msg, 0)
+        queue.join()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].alternatives,
+                         [('<p>Body</p>', 'text/html')])
+
+
 class ConfirmationViewTests(TestCase):
     def _create_user(self, username='john', password='doe'):
         user = get_user_model().objects.create(
@@ -6,7 +6,7 @@ from django.contrib import messages
 from django.contrib.auth import update_session_auth_hash
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.http import HttpResponseRedirect
 from django.utils.http import urlencode
 from django.utils.timezone import now
@@ -130,18 +130,21 @@ def perform_login(request, user, email_verification,
     if not user.is_active:
         return adapter.respond_user_inactive(request, user)
 
-    from .models import EmailAddress
-    has_verified_email = EmailAddress.objects.filter(user=user,
-                                                     verified=True).exists()
+    if email_verification != EmailVerificationMethod.NONE:
+        verification_state = adapter.get_email_verification_state(
+            request, user)
+        has_verified_email = verification_state.has_verified_email
     if email_verification == EmailVerificationMethod.NONE:
         pass
     elif email_verification == EmailVerificationMethod.OPTIONAL:
         # In case of OPTIONAL verification: send on signup.
         if not has_verified_email and signup:
-            send_email_confirmation(request, user, signup=signup)
+            send_email_confirmation(request, user, signup=signup,
+                                    verification_state=verification_state)
     elif email_verification == EmailVerificationMethod.MANDATORY:
         if not has_verified_email:
-            send_email_confirmation(request, user, signup=signup)
+            send_email_confirmation(request, user, signup=signup,
+                                    verification_state=verification_state)
             return adapter.respond_email_verification_sent(
                 request, user)
     try:
@@ -196,14 +199,18 @@ def cleanup_email_addresses(request, addresses):
     primary_addresses = []
     verified_addresses = []
     primary_verified_addresses = []
-    for address in addresses:
-        # Pick up only valid ones...
-        email = valid_email_or_none(address.email)
-        if not email:
-            continue
+    # Pick up only valid ones...
+    addresses = [(address, valid_email_or_none(address.email))
+                 for address in addresses]
+    addresses = [(address, email) for address, email in addresses if email]
+    if app_settings.UNIQUE_EMAIL:
+        existing_emails = EmailAddress.objects.get_existing_emails(
+            email for address, email in addresses)
+    else:
+        existing_emails = set()
+    for address, email in addresses:
         # ... and non-conflicting ones...
-        if (app_settings.UNIQUE_EMAIL and
-                EmailAddress.objects.filter(email__iexact=email).exists()):
+        if email.lower() in existing_emails:
             continue
         a = e2a.get(email.lower())
         if a:
@@ -268,9 +275,9 @@ def setup_user_email(request, user, addresses):
     addresses, primary = cleanup_email_addresses(
         request,
         priority_addresses + addresses)
-    for a in addresses:
-        a.user = user
-        a.save()
+    addresses = EmailAddress.objects.add_for_user(user, addresses)
+    if primary:
+        primary = [a for a in addresses if a.primary][0]
     EmailAddress.objects.fill_cache_for_user(user, addresses)
     if (primary and email and email.lower() != primary.email.lower()):
         user_email(user, primary.email)
@@ -278,7 +285,8 @@ def setup_user_email(request, user, addresses):
     return primary
 
 
-def send_email_confirmation(request, user, signup=False):
+def send_email_confirmation(request, user, signup=False,
+                            verification_state=None):
     """
     E-mail verification mails are sent:
     a) Explicitly: when a user signs up
@@ -289,6 +297,10 @@ def send_email_confirmation(request, user, signup=False):
     sent (consider a user retrying a few times), which is why there is
     a cooldown period before sending a new mail. This cooldown period
     can be configured in ACCOUNT_EMAIL_CONFIRMATION_COOLDOWN setting.
+
+    If available, pass the `verification_state` of the user (see
+    `DefaultAccountAdapter.get_email_verification_state()`) to avoid
+    having to look up the e-mail address and last confirmation again.
     """
     from .models import EmailAddress, EmailConfirmation
 
@@ -299,10 +311,19 @@ def send_email_confirmation(request, user, signup=False):
     email = user_email(user)
     if email:
         try:
-            email_address = EmailAddress.objects.get_for_user(user, email)
+            if verification_state is None:
+                email_address = EmailAddress.objects.get_for_user(user, email)
+            else:
+                email_address = verification_state.get_address(email)
+                if email_address is None:
+                    raise EmailAddress.DoesNotExist()
             if not email_address.verified:
                 if app_settings.EMAIL_CONFIRMATION_HMAC:
                     send_email = True
+                elif verification_state is not None:
+                    last_sent = email_address.last_confirmation_sent
+                    send_email = (last_sent is None or
+                                  last_sent <= now() - cooldown_period)
                 else:
                     send_email = not EmailConfirmation.objects.filter(
                         sent__gt=now() - cooldown_period,
@@ -342,10 +363,11 @@ def sync_user_email_addresses(user):
     """
     from .models import EmailAddress
     email = user_email(user)
+    email_lookup = EmailAddress.objects.email_lookup(email) if email else {}
     if email and not EmailAddress.objects.filter(user=user,
-                                                 email__iexact=email).exists():
+                                                 **email_lookup).exists():
         if app_settings.UNIQUE_EMAIL \
-                and EmailAddress.objects.filter(email__iexact=email).exists():
+                and EmailAddress.objects.filter(**email_lookup).exists():
             # Bail out
             return
         EmailAddress.objects.create(user=user,
@@ -370,21 +392,31 @@ def filter_users_by_username(*username):
     return ret
 
 
-def filter_users_by_email(email):
+def filter_users_by_email(email, prefer_verified=False):
     """Return list of users by email address
 
-    Typically one, at most just a few in length.  First we look through
-    EmailAddress table, than customisable User model table. Add results
-    together avoiding SQL joins and deduplicate.
+    Typically one, at most just a few in length. Users having the address
+    in the EmailAddress table, or in the customisable User model table, are
+    looked up using a single query (the EmailAddress table being queried as
+    a subquery, avoiding duplicates).
+
+    If `prefer_verified` is set, and the address is the verified primary
+    address of any of the users found, only those users are returned.
     """
     from .models import EmailAddress
     User = get_user_model()
-    mails = EmailAddress.objects.filter(email__iexact=email)
-    users = [e.user for e in mails.prefetch_related('user')]
+    mails = EmailAddress.objects.filter(
+        **EmailAddress.objects.email_lookup(email))
+    q = Q(pk__in=mails.values('user'))
     if app_settings.USER_MODEL_EMAIL_FIELD:
-        q_dict = {app_settings.USER_MODEL_EMAIL_FIELD + '__iexact': email}
-        users += list(User.objects.filter(**q_dict))
-    return list(set(users))
+        q |= Q(**{app_settings.USER_MODEL_EMAIL_FIELD + '__iexact': email})
+    users = User.objects.filter(q)
+    if not prefer_verified:
+        return list(users)
+    users = list(users.annotate(allauth_verified_primary=Exists(
+        mails.filter(user=OuterRef('pk'), verified=True, primary=True))))
+    verified_users = [u for u in users if u.allauth_verified_primary]
+    return verified_users or users
 
 
 def passthrough_next_redirect_url(request, url, redirect_field_name):
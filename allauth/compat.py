@@ -18,6 +18,16 @@ try:
 except ImportError:
     from UserDict import UserDict  # noqa
 
+try:
+    from http.cookiejar import DefaultCookiePolicy
+except ImportError:
+    from cookielib import DefaultCookiePolicy  # noqa
+
+try:
+    from queue import Empty, Queue
+except ImportError:
+    from Queue import Empty, Queue  # noqa
+
 try:
     from urllib.parse import parse_qsl, parse_qs, urlparse, urlunparse, urljoin
 except ImportError:
@@ -0,0 +1,49 @@
+"""
+Fixed window counters, kept in the Django cache.
+
+A counter is created by the first hit, and expires a fixed number of
+seconds later: later hits do not extend the window. Counters are only ever
+changed using the atomic `cache.add()` and
+`cache.incr()` operations, so that concurrent hits cannot get lost (as
+opposed to a read-modify-write of the cached value), and each counter takes
+up constant space regardless of the number of hits.
+"""
+from django.core.cache import cache
+
+
+def hit(key, timeout):
+    """
+    Registers a hit on the counter stored at `key`, which expires `timeout`
+    seconds after the first hit. Returns the new count.
+    """
+    if cache.add(key, 1, timeout):
+        return 1
+    try:
+        count = cache.incr(key)
+    except ValueError:
+        # Expired in between the `add()` and `incr()`.
+        cache.add(key, 1, timeout)
+        return 1
+    return count
+
+
+def get_counts(keys):
+    """
+    Returns the current counts for `keys`, as a dictionary, using a single
+    cache round trip.
+    """
+    counts = cache.get_many(keys)
+    return dict((key, counts.get(key, 0)) for key in keys)
+
+
+def is_exceeded(limits):
+    """
+    `limits` maps counter keys to their limit. Returns whether or not any of
+    the limits has been reached.
+    """
+    counts = get_counts(list(limits.keys()))
+    return any(counts[key] >= limit for key, limit in limits.items())
+
+
+def clear(key):
+    cache.delete(key)
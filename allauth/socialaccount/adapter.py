@@ -1,9 +1,13 @@
 from __future__ import absolute_import
 
+import requests
+import threading
+from requests.adapters import HTTPAdapter
+
 from django.core.exceptions import ValidationError
 from django.urls import reverse
 
-from allauth.compat import ugettext_lazy as _
+from allauth.compat import DefaultCookiePolicy, ugettext_lazy as _
 
 from ..account import app_settings as account_settings
 from ..account.adapter import get_adapter as get_account_adapter
@@ -20,6 +24,33 @@ from ..utils import (
 from . import app_settings
 
 
+class ProviderSession(requests.Session):
+    """
+    A `requests.Session` shared by all outbound calls to the providers.
+    Connections are pooled (and kept alive) per host, a default timeout
+    is applied, and cookies are never stored, as the session is shared
+    between users.
+    """
+    def __init__(self, timeout=None, pool_connections=10, pool_maxsize=10,
+                 max_retries=0):
+        super(ProviderSession, self).__init__()
+        self.timeout = timeout
+        self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        for prefix in ('https://', 'http://'):
+            self.mount(prefix, HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries))
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super(ProviderSession, self).request(method, url, **kwargs)
+
+
+_requests_session = None
+_requests_session_lock = threading.Lock()
+
+
 class DefaultSocialAccountAdapter(object):
 
     error_messages = {
@@ -185,6 +216,24 @@ class DefaultSocialAccountAdapter(object):
             'last_name': user_field(user, 'last_name') or ''}
         return initial
 
+    def get_requests_session(self):
+        """
+        Returns the `requests.Session` used for all outbound calls to the
+        providers. It is created once per process, so that connections to
+        the provider endpoints are reused across logins.
+        """
+        global _requests_session
+        if _requests_session is None:
+            with _requests_session_lock:
+                if _requests_session is None:
+                    _requests_session = ProviderSession(
+                        timeout=app_settings.REQUESTS_TIMEOUT,
+                        pool_connections=(
+                            app_settings.REQUESTS_POOL_CONNECTIONS),
+                        pool_maxsize=app_settings.REQUESTS_POOL_MAXSIZE,
+                        max_retries=app_settings.REQUESTS_MAX_RETRIES)
+        return _requests_session
+
     def deserialize_instance(self, model, data):
         return deserialize_instance(model, data)
 
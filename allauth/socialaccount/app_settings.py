@@ -67,6 +67,70 @@ class AppSettings(object):
     def STORE_TOKENS(self):
         return self._setting('STORE_TOKENS', True)
 
+    @property
+    def APP_CACHE_TIMEOUT(self):
+        """
+        Number of seconds `SocialApp` instances are kept in the process
+        wide cache. `None` disables caching.
+        """
+        return self._setting('APP_CACHE_TIMEOUT', None)
+
+    @property
+    def APP_CACHE_ALIAS(self):
+        """
+        Optional Django cache alias used to share cached `SocialApp`
+        instances between processes.
+        """
+        return self._setting('APP_CACHE_ALIAS', None)
+
+    @property
+    def MEDIA_JS_CACHE_TIMEOUT(self):
+        """
+        Number of seconds the request independent part of the provider
+        media JS (`{% providers_media_js %}`) is cached. `None` disables
+        caching.
+        """
+        return self._setting('MEDIA_JS_CACHE_TIMEOUT', None)
+
+    @property
+    def REQUESTS_TIMEOUT(self):
+        """
+        Timeout (in seconds) applied to outbound requests made to the
+        providers. `None` means no timeout.
+        """
+        return self._setting('REQUESTS_TIMEOUT', None)
+
+    @property
+    def REQUESTS_POOL_CONNECTIONS(self):
+        """
+        Number of per-host connection pools kept by the shared requests
+        session.
+        """
+        return self._setting('REQUESTS_POOL_CONNECTIONS', 10)
+
+    @property
+    def REQUESTS_POOL_MAXSIZE(self):
+        """
+        Maximum number of keep-alive connections kept per host.
+        """
+        return self._setting('REQUESTS_POOL_MAXSIZE', 10)
+
+    @property
+    def REQUESTS_MAX_RETRIES(self):
+        """
+        Number of retries on connection failures (requests that did not
+        reach the provider).
+        """
+        return self._setting('REQUESTS_MAX_RETRIES', 0)
+
+    @property
+    def LAZY_PROVIDERS(self):
+        """
+        Register the builtin providers from a static manifest, and only
+        import a provider (including its views) once it is actually used.
+        """
+        return self._setting('LAZY_PROVIDERS', False)
+
     @property
     def UID_MAX_LENGTH(self):
         return 191
@@ -43,7 +43,8 @@ class DisconnectForm(forms.Form):
 
     def __init__(self, *args, **kwargs):
         self.request = kwargs.pop('request')
-        self.accounts = SocialAccount.objects.filter(user=self.request.user)
+        self.accounts = SocialAccount.objects.get_for_user(
+            self.request.user, self.request)
         super(DisconnectForm, self).__init__(*args, **kwargs)
         self.fields['account'].queryset = self.accounts
 
@@ -59,6 +60,9 @@ class DisconnectForm(forms.Form):
     def save(self):
         account = self.cleaned_data['account']
         account.delete()
+        # The accounts shared for the duration of the request are stale.
+        getattr(self.request, '_socialaccount_cache', {}).pop(
+            account.user_id, None)
         signals.social_account_removed.send(sender=SocialAccount,
                                             request=self.request,
                                             socialaccount=account)
@@ -0,0 +1,80 @@
+import time
+from datetime import timedelta
+from requests import RequestException
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from allauth.socialaccount import providers
+from allauth.socialaccount.models import SocialToken
+from allauth.socialaccount.providers.oauth2.client import OAuth2Error
+from allauth.socialaccount.providers.oauth2.provider import OAuth2Provider
+from allauth.socialaccount.providers.oauth2.tokens import OAuth2TokenManager
+
+
+class Command(BaseCommand):
+    help = ('Refreshes the OAuth2 access tokens that expire within the'
+            ' given number of seconds, using their refresh tokens.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--within', type=int, default=300)
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--provider', action='append', dest='providers')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        manager = OAuth2TokenManager(margin=options['within'])
+        tokens = self.get_tokens(options['within'], options['providers'])
+        total = tokens.count()
+        refreshed = failed = 0
+        start = time.time()
+        batch = []
+        for token in tokens.iterator():
+            batch.append(token)
+            if len(batch) < batch_size:
+                continue
+            batch_refreshed = self.refresh_batch(manager, batch)
+            refreshed += batch_refreshed
+            failed += len(batch) - batch_refreshed
+            batch = []
+            self.report(refreshed, failed, total, start)
+        if batch:
+            batch_refreshed = self.refresh_batch(manager, batch)
+            refreshed += batch_refreshed
+            failed += len(batch) - batch_refreshed
+        self.report(refreshed, failed, total, start)
+
+    def get_tokens(self, within, provider_ids=None):
+        if not provider_ids:
+            provider_ids = [
+                provider_class.id
+                for provider_class in providers.registry.get_class_list()
+                if issubclass(provider_class, OAuth2Provider)]
+        return SocialToken.objects.filter(
+            account__provider__in=provider_ids,
+            expires_at__lte=timezone.now() + timedelta(seconds=within),
+        ).exclude(
+            token_secret=''
+        ).select_related('app', 'account').order_by('pk')
+
+    def refresh_batch(self, manager, batch):
+        """
+        Refreshes the tokens in `batch`. Returns the number of tokens
+        refreshed.
+        """
+        refreshed = 0
+        for token in batch:
+            try:
+                manager.refresh(token)
+            except (OAuth2Error, RequestException) as e:
+                self.stderr.write('Failed to refresh token %s (%s): %s' % (
+                    token.pk, token.account.provider, e))
+            else:
+                refreshed += 1
+        return refreshed
+
+    def report(self, refreshed, failed, total, start):
+        elapsed = time.time() - start
+        rate = refreshed / elapsed if elapsed else 0
+        self.stdout.write('%d/%d refreshed, %d failed (%.1f tokens/s)' % (
+            refreshed, total, failed, rate))
@@ -1,12 +1,15 @@
 from __future__ import absolute_import
 
 import json
+import time
 
 from django.contrib.auth import authenticate
 from django.contrib.sites.models import Site
 from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import caches
 from django.core.exceptions import PermissionDenied
 from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils.crypto import get_random_string
 
 import allauth.app_settings
@@ -25,6 +28,66 @@ from .adapter import get_adapter
 from .fields import JSONField
 
 
+class SocialAppCache(object):
+    """
+    Process wide cache of `SocialApp` instances, keyed by (site,
+    provider). Optionally backed by a Django cache (see
+    `SOCIALACCOUNT_APP_CACHE_ALIAS`) so that processes share lookups
+    and invalidations. Entries are invalidated whenever a `SocialApp`
+    (or its sites) changes. When a shared cache is used, local entries
+    are stored along with the shared version, which is checked on every
+    lookup so that invalidations by other processes are seen at once.
+    """
+    version_key = 'allauth.socialapp.version'
+
+    def __init__(self):
+        self.local = {}
+
+    def get_shared_cache(self):
+        alias = app_settings.APP_CACHE_ALIAS
+        if alias:
+            return caches[alias]
+        return None
+
+    def make_key(self, site_id, provider, version):
+        return 'allauth.socialapp.%s.%s.%s' % (version, site_id, provider)
+
+    def get(self, site_id, provider, lookup):
+        timeout = app_settings.APP_CACHE_TIMEOUT
+        if timeout is None:
+            return lookup()
+        now = time.time()
+        shared = self.get_shared_cache()
+        version = None
+        if shared is not None:
+            version = shared.get(self.version_key, 0)
+        entry = self.local.get((site_id, provider))
+        if entry and entry[0] > now and entry[1] == version:
+            return entry[2]
+        app = None
+        if shared is not None:
+            key = self.make_key(site_id, provider, version)
+            app = shared.get(key)
+        if app is None:
+            app = lookup()
+            if shared is not None:
+                shared.set(key, app, timeout)
+        self.local[(site_id, provider)] = (now + timeout, version, app)
+        return app
+
+    def clear(self):
+        self.local.clear()
+        shared = self.get_shared_cache()
+        if shared is not None:
+            try:
+                shared.incr(self.version_key)
+            except ValueError:
+                shared.set(self.version_key, 1, None)
+
+
+socialapp_cache = SocialAppCache()
+
+
 class SocialAppManager(models.Manager):
     def get_current(self, provider, request=None):
         cache = {}
@@ -34,9 +97,10 @@ class SocialAppManager(models.Manager):
         app = cache.get(provider)
         if not app:
             site = get_current_site(request)
-            app = self.get(
-                sites__id=site.id,
-                provider=provider)
+            app = socialapp_cache.get(
+                site.id,
+                provider,
+                lambda: self.get(sites__id=site.id, provider=provider))
             cache[provider] = app
         return app
 
@@ -75,8 +139,42 @@ class SocialApp(models.Model):
         return self.name
 
 
+def _invalidate_socialapp_cache(sender, **kwargs):
+    socialapp_cache.clear()
+
+
+post_save.connect(_invalidate_socialapp_cache, sender=SocialApp)
+post_delete.connect(_invalidate_socialapp_cache, sender=SocialApp)
+m2m_changed.connect(_invalidate_socialapp_cache,
+                    sender=SocialApp.sites.through)
+
+
+class SocialAccountManager(models.Manager):
+    def get_for_user(self, user, request=None):
+        """
+        Returns the social accounts of `user`, as an evaluated queryset.
+        When a request is passed, the accounts are fetched only once for
+        the duration of the request, and shared by e.g. the
+        `get_social_accounts` template tag, the connections view and the
+        disconnect form.
+        """
+        cache = {}
+        if request:
+            cache = getattr(request, '_socialaccount_cache', {})
+            request._socialaccount_cache = cache
+        accounts = cache.get(user.pk)
+        if accounts is None:
+            accounts = self.filter(user=user)
+            for account in accounts:
+                account.user = user
+            cache[user.pk] = accounts
+        return accounts
+
+
 @python_2_unicode_compatible
 class SocialAccount(models.Model):
+    objects = SocialAccountManager()
+
     user = models.ForeignKey(allauth.app_settings.USER_MODEL,
                              on_delete=models.CASCADE)
     provider = models.CharField(verbose_name=_('provider'),
@@ -127,7 +225,11 @@ class SocialAccount(models.Model):
         return providers.registry.by_id(self.provider)
 
     def get_provider_account(self):
-        return self.get_provider().wrap_account(self)
+        provider_account = getattr(self, '_provider_account', None)
+        if provider_account is None:
+            provider_account = self._provider_account = \
+                self.get_provider().wrap_account(self)
+        return provider_account
 
 
 @python_2_unicode_compatible
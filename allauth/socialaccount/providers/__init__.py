@@ -2,30 +2,114 @@ import importlib
 from collections import OrderedDict
 
 from django.conf import settings
+from django.core.signals import setting_changed
+
+from allauth.socialaccount import app_settings
+
+
+class ProviderManifestEntry(object):
+    """
+    Stand-in for a provider class that has not been imported yet, see
+    `SOCIALACCOUNT_LAZY_PROVIDERS`.
+    """
+    def __init__(self, package, id, name, slug, urls):
+        self.package = package
+        self.id = id
+        self.name = name
+        self.slug = slug
+        self.urls = urls
+
+    def get_package(self):
+        return self.package
+
+    def get_slug(self):
+        return self.slug
 
 
 class ProviderRegistry(object):
     def __init__(self):
         self.provider_map = OrderedDict()
+        self.manifest = OrderedDict()
         self.loaded = False
+        # Provider instances not bound to a request, and the provider
+        # settings, keyed by provider id.
+        self.instances = {}
+        self.settings = {}
 
     def get_list(self, request=None):
-        self.load()
         return [
-            provider_cls(request)
-            for provider_cls in self.provider_map.values()]
+            self.by_id(provider_cls.id, request)
+            for provider_cls in self.get_class_list()]
 
     def register(self, cls):
         self.provider_map[cls.id] = cls
 
     def by_id(self, id, request=None):
+        """
+        Returns the provider instance for `id`. Instances are reused for the
+        duration of the request, or for the lifetime of the process if no
+        request is passed.
+        """
+        if request is None:
+            instances = self.instances
+        else:
+            instances = getattr(request, '_socialaccount_providers', None)
+            if instances is None:
+                instances = request._socialaccount_providers = {}
+        provider = instances.get(id)
+        if provider is None:
+            provider = instances[id] = self.get_class(id)(request=request)
+        return provider
+
+    def get_settings(self, id):
+        provider_settings = self.settings.get(id)
+        if provider_settings is None:
+            provider_settings = self.settings[id] = \
+                app_settings.PROVIDERS.get(id, {})
+        return provider_settings
+
+    def clear_cache(self):
+        self.instances.clear()
+        self.settings.clear()
+
+    def get_class(self, id):
         self.load()
-        return self.provider_map[id](request=request)
+        provider_cls = self.provider_map.get(id)
+        if provider_cls is None:
+            entry = self.manifest[id]
+            self._import_provider_module(entry.get_package())
+            provider_cls = self.provider_map[id]
+        return provider_cls
 
-    def as_choices(self):
+    def get_class_list(self):
         self.load()
-        for provider_cls in self.provider_map.values():
-            yield (provider_cls.id, provider_cls.name)
+        return [self.get_class(id) for id in self._get_ids()]
+
+    def get_entry_list(self):
+        """
+        Returns the registered provider classes, or their manifest entries
+        for the providers that have not been imported yet.
+        """
+        self.load()
+        return [
+            self.provider_map.get(id) or self.manifest[id]
+            for id in self._get_ids()]
+
+    def as_choices(self):
+        for entry in self.get_entry_list():
+            yield (entry.id, entry.name)
+
+    def _get_ids(self):
+        ids = list(self.manifest.keys())
+        ids.extend(id for id in self.provider_map if id not in self.manifest)
+        return ids
+
+    def _import_provider_module(self, package):
+        provider_module = importlib.import_module(package + '.provider')
+        provider_classes = getattr(provider_module, 'provider_classes', [])
+        for cls in provider_classes:
+            self.register(cls)
+        return provider_classes
 
     def load(self):
         # TODO: Providers register with the provider registry when
@@ -35,19 +119,28 @@ class ProviderRegistry(object):
         # mechanism is way to magical and depends on the import order et al, so
         # all of this really needs to be revisited.
         if not self.loaded:
+            manifest = {}
+            if app_settings.LAZY_PROVIDERS:
+                from .manifest import PROVIDERS as manifest
             for app in settings.INSTALLED_APPS:
+                if app in manifest:
+                    for id, name, slug, urls in manifest[app]:
+                        self.manifest[id] = ProviderManifestEntry(
+                            app, id, name, slug, urls)
+                    continue
                 try:
-                    provider_module = importlib.import_module(
-                        app + '.provider'
-                    )
+                    self._import_provider_module(app)
                 except ImportError:
                     pass
-                else:
-                    for cls in getattr(
-                        provider_module, 'provider_classes', []
-                    ):
-                        self.register(cls)
             self.loaded = True
 
 
 registry = ProviderRegistry()
+
+
+def _clear_registry_cache(setting, **kwargs):
+    if setting.startswith('SOCIALACCOUNT_') or setting.startswith('ALLAUTH_'):
+        registry.clear_cache()
+
+
+setting_changed.connect(_clear_registry_cache)
@@ -1,6 +1,5 @@
-import requests
-
 from allauth.socialaccount import app_settings
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.agave.provider import AgaveProvider
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
@@ -20,11 +19,10 @@ class AgaveAdapter(OAuth2Adapter):
     profile_url = '{0}/profiles/v2/me'.format(provider_base_url)
 
     def complete_login(self, request, app, token, response):
-        extra_data = requests.get(self.profile_url, params={
-            'access_token': token.token
-        }, headers={
-            'Authorization': 'Bearer ' + token.token,
-        })
+        extra_data = get_adapter().get_requests_session().get(
+            self.profile_url,
+            params={'access_token': token.token},
+            headers={'Authorization': 'Bearer ' + token.token})
 
         user_profile = extra_data.json()['result'] \
             if 'result' in extra_data.json() \
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -18,7 +17,7 @@ class AmazonOAuth2Adapter(OAuth2Adapter):
     redirect_uri_protocol = 'https'
 
     def complete_login(self, request, app, token, **kwargs):
-        response = requests.get(
+        response = get_adapter().get_requests_session().get(
             self.profile_url,
             params={'access_token': token})
         extra_data = response.json()
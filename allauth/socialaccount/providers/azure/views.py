@@ -1,7 +1,6 @@
 from __future__ import unicode_literals
 
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -34,7 +33,8 @@ class AzureOAuth2Adapter(OAuth2Adapter):
         headers = {'Authorization': 'Bearer {0}'.format(token.token)}
         extra_data = {}
 
-        resp = requests.get(self.profile_url, headers=headers)
+        resp = get_adapter().get_requests_session().get(
+            self.profile_url, headers=headers)
 
 # See:
 #
@@ -1,10 +1,35 @@
+from weakref import WeakKeyDictionary
+
+from django.urls import get_resolver, get_script_prefix, get_urlconf, reverse
+from django.utils.translation import get_language
+
 from allauth.account.models import EmailAddress
 from allauth.compat import python_2_unicode_compatible
-from allauth.socialaccount import app_settings
 
 from ..adapter import get_adapter
 
 
+# Reversed login URLs, per URL resolver, see `reverse_login_url()`.
+_login_urls = WeakKeyDictionary()
+
+
+def reverse_login_url(viewname):
+    """
+    A cached `reverse()` for the (argument-less) login URLs of the
+    providers. The cache is kept per URL resolver, so it is dropped
+    whenever the URLConf is reloaded (`clear_url_caches()`).
+    """
+    resolver = get_resolver(get_urlconf())
+    urls = _login_urls.get(resolver)
+    if urls is None:
+        urls = _login_urls[resolver] = {}
+    key = (viewname, get_script_prefix(), get_language())
+    url = urls.get(key)
+    if url is None:
+        url = urls[key] = reverse(viewname)
+    return url
+
+
 class AuthProcess(object):
     LOGIN = 'login'
     CONNECT = 'connect'
@@ -61,7 +86,9 @@ class Provider(object):
         return self.account_class(social_account)
 
     def get_settings(self):
-        return app_settings.PROVIDERS.get(self.id, {})
+        from allauth.socialaccount.providers import registry
+
+        return registry.get_settings(self.id)
 
     def sociallogin_from_response(self, request, response):
         """
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+from requests import ConnectionError
+
 from django.test.utils import override_settings
 
 from allauth.socialaccount.models import SocialAccount
@@ -94,15 +96,19 @@ class BitbucketOAuth2Tests(create_oauth2_tests(registry.by_id(
     def setUp(self):
         super(BitbucketOAuth2Tests, self).setUp()
         self.mocks = {
-            'requests': patch('allauth.socialaccount.providers'
-                              '.bitbucket_oauth2.views.requests')
+            'requests': patch('requests.Session.get')
         }
         self.patches = dict((name, mocked.start())
                             for (name, mocked) in self.mocks.items())
-        self.patches['requests'].get.side_effect = [
-            MockedResponse(200, self.response_data),
-            MockedResponse(200, self.email_response_data),
-        ]
+        # The profile and e-mail addresses are fetched concurrently, so
+        # respond based on the URL rather than on the order of the calls.
+        self.responses = responses = {
+            'https://api.bitbucket.org/2.0/user': self.response_data,
+            'https://api.bitbucket.org/2.0/user/emails':
+            self.email_response_data,
+        }
+        self.patches['requests'].side_effect = (
+            lambda url, **kwargs: MockedResponse(200, responses[url]))
 
     def tearDown(self):
         for (_, mocked) in self.mocks.items():
@@ -112,13 +118,6 @@ class BitbucketOAuth2Tests(create_oauth2_tests(registry.by_id(
         return [MockedResponse(200, self.response_data)]
 
     def test_account_tokens(self, multiple_login=False):
-        if multiple_login:
-            self.patches['requests'].get.side_effect = [
-                MockedResponse(200, self.response_data),
-                MockedResponse(200, self.email_response_data),
-                MockedResponse(200, self.response_data),
-                MockedResponse(200, self.email_response_data),
-            ]
         super(BitbucketOAuth2Tests, self).test_account_tokens(multiple_login)
         calls = [
             mock.call('https://api.bitbucket.org/2.0/user',
@@ -133,7 +132,24 @@ class BitbucketOAuth2Tests(create_oauth2_tests(registry.by_id(
                 mock.call('https://api.bitbucket.org/2.0/user/emails',
                           params=mock.ANY),
             ])
-        self.patches['requests'].get.assert_has_calls(calls)
+        self.patches['requests'].assert_has_calls(calls, any_order=True)
+
+    def test_emails_request_failure(self):
+        failures = []
+
+        def get(url, **kwargs):
+            if url.endswith('/emails') and not failures:
+                failures.append(url)
+                raise ConnectionError()
+            return MockedResponse(200, self.responses[url])
+
+        self.patches['requests'].side_effect = get
+        self.login(self.get_mocked_response())
+        # The profile has no e-mail address, so the failed request is
+        # retried.
+        socialaccount = SocialAccount.objects.get(uid='tutorials')
+        self.assertEqual(socialaccount.user.email, 'tutorials@bitbucket.org')
+        self.assertEqual(len(failures), 1)
 
     def test_provider_account(self):
         self.login(self.get_mocked_response())
@@ -150,9 +166,9 @@ class BitbucketOAuth2Tests(create_oauth2_tests(registry.by_id(
             account.get_avatar_url(),
             'https://bitbucket-assetroot.s3.amazonaws.com/c/photos/2013/Nov/25/tutorials-avatar-1563784409-6_avatar.png'  # noqa
         )
-        self.patches['requests'].get.assert_has_calls([
+        self.patches['requests'].assert_has_calls([
             mock.call('https://api.bitbucket.org/2.0/user',
                       params=mock.ANY),
             mock.call('https://api.bitbucket.org/2.0/user/emails',
                       params=mock.ANY),
-        ])
+        ], any_order=True)
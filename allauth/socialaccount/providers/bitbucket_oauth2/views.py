@@ -1,6 +1,5 @@
-import requests
-
 from allauth.socialaccount import app_settings
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -18,18 +17,32 @@ class BitbucketOAuth2Adapter(OAuth2Adapter):
     emails_url = 'https://api.bitbucket.org/2.0/user/emails'
 
     def complete_login(self, request, app, token, **kwargs):
-        resp = requests.get(self.profile_url,
-                            params={'access_token': token.token})
-        extra_data = resp.json()
-        if app_settings.QUERY_EMAIL and not extra_data.get('email'):
-            extra_data['email'] = self.get_email(token)
+        params = {'access_token': token.token}
+        requests = {'profile': ('GET', self.profile_url, {'params': params})}
+        if app_settings.QUERY_EMAIL:
+            requests['emails'] = ('GET', self.emails_url, {'params': params})
+        responses = self.fetch_concurrently(requests, optional=['emails'])
+        extra_data = responses['profile'].json()
+        if 'emails' in responses and not extra_data.get('email'):
+            resp = responses['emails']
+            if isinstance(resp, Exception):
+                # The speculative fetch failed, retry now that it turns
+                # out to be needed.
+                extra_data['email'] = self.get_email(token)
+            else:
+                extra_data['email'] = self.extract_email(resp)
         return self.get_provider().sociallogin_from_response(request,
                                                              extra_data)
 
     def get_email(self, token):
         """Fetches email address from email API endpoint"""
-        resp = requests.get(self.emails_url,
-                            params={'access_token': token.token})
+        resp = get_adapter().get_requests_session().get(
+            self.emails_url,
+            params={'access_token': token.token})
+        return self.extract_email(resp)
+
+    def extract_email(self, resp):
+        """Extracts the primary email address from an email API response"""
         emails = resp.json().get('values', [])
         email = ''
         try:
@@ -1,5 +1,3 @@
-import requests
-
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -21,10 +19,11 @@ class CernOAuth2Adapter(OAuth2Adapter):
 
     def complete_login(self, request, app, token, **kwargs):
         headers = {'Authorization': 'Bearer {0}'.format(token.token)}
-        user_response = requests.get(self.profile_url, headers=headers)
-        groups_response = requests.get(self.groups_url, headers=headers)
-        extra_data = user_response.json()
-        extra_data.update(groups_response.json())
+        responses = self.fetch_concurrently({
+            'user': ('GET', self.profile_url, {'headers': headers}),
+            'groups': ('GET', self.groups_url, {'headers': headers})})
+        extra_data = responses['user'].json()
+        extra_data.update(responses['groups'].json())
         return self.get_provider().sociallogin_from_response(request,
                                                              extra_data)
 
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -25,8 +24,9 @@ class CoinbaseOAuth2Adapter(OAuth2Adapter):
         return 'https://coinbase.com/api/v1/users'
 
     def complete_login(self, request, app, token, **kwargs):
-        response = requests.get(self.profile_url,
-                                params={'access_token': token})
+        response = get_adapter().get_requests_session().get(
+            self.profile_url,
+            params={'access_token': token})
         extra_data = response.json()['users'][0]['user']
         return self.get_provider().sociallogin_from_response(
             request, extra_data)
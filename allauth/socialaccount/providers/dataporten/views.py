@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.base import ProviderException
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
@@ -34,7 +33,7 @@ class DataportenAdapter(OAuth2Adapter):
 
         # Userinfo endpoint, for documentation see:
         # https://docs.dataporten.no/docs/oauth-authentication/
-        userinfo_response = requests.get(
+        userinfo_response = get_adapter().get_requests_session().get(
             self.profile_url,
             headers=headers,
         )
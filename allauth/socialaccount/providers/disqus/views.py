@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -17,10 +16,11 @@ class DisqusOAuth2Adapter(OAuth2Adapter):
     scope_delimiter = ','
 
     def complete_login(self, request, app, token, **kwargs):
-        resp = requests.get(self.profile_url, params={
-                            'access_token': token.token,
-                            'api_key': app.client_id,
-                            'api_secret': app.secret})
+        resp = get_adapter().get_requests_session().get(
+            self.profile_url,
+            params={'access_token': token.token,
+                    'api_key': app.client_id,
+                    'api_secret': app.secret})
         resp.raise_for_status()
 
         extra_data = resp.json().get('response')
@@ -1,7 +1,10 @@
-from django.urls import reverse
 from django.utils.http import urlencode
 
-from allauth.socialaccount.providers.base import Provider, ProviderAccount
+from allauth.socialaccount.providers.base import (
+    Provider,
+    ProviderAccount,
+    reverse_login_url,
+)
 
 
 class DraugiemAccount(ProviderAccount):
@@ -40,7 +43,7 @@ class DraugiemProvider(Provider):
     account_class = DraugiemAccount
 
     def get_login_url(self, request, **kwargs):
-        url = reverse(self.id + "_login")
+        url = reverse_login_url(self.id + "_login")
         if kwargs:
             url = url + '?' + urlencode(kwargs)
         return url
@@ -7,6 +7,7 @@ from django.utils.http import urlencode
 from django.views.decorators.csrf import csrf_exempt
 
 from allauth.socialaccount import providers
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.helpers import (
     complete_social_login,
     render_authentication_error,
@@ -76,7 +77,7 @@ def callback(request):
 
 def draugiem_complete_login(request, app, code):
     provider = providers.registry.by_id(DraugiemProvider.id, request)
-    response = requests.get(ACCESS_TOKEN_URL, {
+    response = get_adapter().get_requests_session().get(ACCESS_TOKEN_URL, {
         'action': 'authorize',
         'app': app.secret,
         'code': code
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -17,9 +16,9 @@ class DropboxOAuth2Adapter(OAuth2Adapter):
     redirect_uri_protocol = 'https'
 
     def complete_login(self, request, app, token, **kwargs):
-        extra_data = requests.post(self.profile_url, headers={
-            'Authorization': 'Bearer %s' % (token.token, )
-        })
+        extra_data = get_adapter().get_requests_session().post(
+            self.profile_url,
+            headers={'Authorization': 'Bearer %s' % (token.token, )})
 
         # This only here because of weird response from the test suite
         if isinstance(extra_data, list):
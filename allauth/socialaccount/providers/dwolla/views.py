@@ -1,7 +1,6 @@
-import requests
-
 from django.conf import settings
 
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -40,7 +39,7 @@ class DwollaOAuth2Adapter(OAuth2Adapter):
 
     def complete_login(self, request, app, token, response, **kwargs):
 
-        resp = requests.get(
+        resp = get_adapter().get_requests_session().get(
             response['_links']['account']['href'],
             headers={
                 'authorization': 'Bearer %s' % token.token,
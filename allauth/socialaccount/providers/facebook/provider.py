@@ -1,16 +1,23 @@
+import hashlib
 import json
 import string
 
 from django.conf import settings
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 from django.middleware.csrf import get_token
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.crypto import get_random_string
+from django.utils.encoding import force_bytes
 from django.utils.html import escapejs, mark_safe
 from django.utils.http import urlquote
+from django.utils.translation import get_language
 
 from allauth.account.models import EmailAddress
+from allauth.socialaccount import app_settings
 from allauth.socialaccount.app_settings import QUERY_EMAIL
 from allauth.socialaccount.providers.base import (
     AuthAction,
@@ -30,6 +37,22 @@ GRAPH_API_URL = 'https://graph.facebook.com/' + GRAPH_API_VERSION
 NONCE_SESSION_KEY = 'allauth_facebook_nonce'
 NONCE_LENGTH = 32
 
+# Rendered `facebook/fbconnect.html` fragments, together with the request
+# independent part of the settings passed to the JS SDK, are kept in the
+# Django cache, see `FacebookProvider.media_js()`. The version is part of
+# the cache key, and is bumped whenever the settings change.
+FB_DATA_PLACEHOLDER = '__allauth_facebook_data__'
+FB_DATA_URLS = ('loginByTokenUrl', 'cancelUrl', 'logoutUrl', 'loginUrl',
+                'errorUrl')
+_media_js_cache_version = [0]
+
+
+def _clear_media_js_cache(setting, **kwargs):
+    _media_js_cache_version[0] += 1
+
+
+setting_changed.connect(_clear_media_js_cache)
+
 
 class FacebookAccount(ProviderAccount):
     def get_profile_url(self):
@@ -150,6 +173,49 @@ class FacebookProvider(OAuth2Provider):
             sdk_url = sdk_url.format(locale=locale)
         return sdk_url
 
+    def get_media_js_data(self, request, app, sdk_url):
+        """
+        The part of the settings passed to the JS SDK that does not
+        depend on the current request, and can therefore be cached. The
+        URLs (`FB_DATA_URLS`) are made absolute per request.
+        """
+        return {
+            "appId": app.client_id,
+            "version": GRAPH_API_VERSION,
+            "sdkUrl": sdk_url,
+            "initParams": self.get_init_params(request, app),
+            "loginByTokenUrl": reverse('facebook_login_by_token'),
+            "cancelUrl": reverse('socialaccount_login_cancelled'),
+            "logoutUrl": reverse('account_logout'),
+            "loginUrl": self.get_login_url(request, method='oauth2'),
+            "errorUrl": reverse('socialaccount_login_error'),
+        }
+
+    def _render_media_js(self, request, fb_data):
+        ctx = {'fb_data': mark_safe(fb_data)}
+        return render_to_string('facebook/fbconnect.html', ctx,
+                                request=request)
+
+    def _add_request_data(self, request, data):
+        ret = dict(data,
+                   loginOptions=self.get_fb_login_options(request),
+                   csrfToken=get_token(request))
+        for name in FB_DATA_URLS:
+            ret[name] = request.build_absolute_uri(data[name])
+        return ret
+
+    def get_media_js_cache_key(self, request, app, sdk_url):
+        site = get_current_site(request)
+        key = repr((_media_js_cache_version[0],
+                    site.pk,
+                    getattr(request, 'urlconf', None),
+                    get_language(),
+                    sdk_url,
+                    app.pk,
+                    app.client_id))
+        return 'allauth.facebook.media_js.' + hashlib.sha256(
+            force_bytes(key)).hexdigest()
+
     def media_js(self, request):
         # NOTE: Avoid loading models at top due to registry boot...
         from allauth.socialaccount.models import SocialApp
@@ -160,28 +226,22 @@ class FacebookProvider(OAuth2Provider):
             raise ImproperlyConfigured("No Facebook app configured: please"
                                        " add a SocialApp using the Django"
                                        " admin")
-
-        def abs_uri(name):
-            return request.build_absolute_uri(reverse(name))
-
-        fb_data = {
-            "appId": app.client_id,
-            "version": GRAPH_API_VERSION,
-            "sdkUrl": self.get_sdk_url(request),
-            "initParams": self.get_init_params(request, app),
-            "loginOptions": self.get_fb_login_options(request),
-            "loginByTokenUrl": abs_uri('facebook_login_by_token'),
-            "cancelUrl": abs_uri('socialaccount_login_cancelled'),
-            "logoutUrl": abs_uri('account_logout'),
-            "loginUrl": request.build_absolute_uri(self.get_login_url(
-                request,
-                method='oauth2')),
-            "errorUrl": abs_uri('socialaccount_login_error'),
-            "csrfToken": get_token(request)
-        }
-        ctx = {'fb_data': mark_safe(json.dumps(fb_data))}
-        return render_to_string('facebook/fbconnect.html', ctx,
-                                request=request)
+        sdk_url = self.get_sdk_url(request)
+        timeout = app_settings.MEDIA_JS_CACHE_TIMEOUT
+        if timeout is None:
+            data = self.get_media_js_data(request, app, sdk_url)
+            fb_data = self._add_request_data(request, data)
+            return self._render_media_js(request, json.dumps(fb_data))
+        key = self.get_media_js_cache_key(request, app, sdk_url)
+        entry = cache.get(key)
+        if entry is None:
+            data = self.get_media_js_data(request, app, sdk_url)
+            html = self._render_media_js(request, FB_DATA_PLACEHOLDER)
+            entry = (data, html)
+            cache.set(key, entry, timeout)
+        # Only the per request bits are added to the cached fragment.
+        fb_data = self._add_request_data(request, entry[0])
+        return entry[1].replace(FB_DATA_PLACEHOLDER, json.dumps(fb_data))
 
     def get_nonce(self, request, or_create=False, pop=False):
         if pop:
@@ -3,6 +3,7 @@ import json
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
 from django.urls import reverse
+from django.utils import translation
 
 from allauth.account import app_settings as account_settings
 from allauth.account.models import EmailAddress
@@ -12,6 +13,7 @@ from allauth.socialaccount.tests import OAuth2TestsMixin
 from allauth.tests import MockedResponse, TestCase, patch
 from allauth.utils import get_user_model
 
+from . import locale, provider as provider_module
 from .provider import FacebookProvider
 
 
@@ -82,12 +84,39 @@ class FacebookTests(OAuth2TestsMixin, TestCase):
         script = provider.media_js(request)
         self.assertTrue('"appId": "app123id"' in script)
 
+    @override_settings(SOCIALACCOUNT_MEDIA_JS_CACHE_TIMEOUT=60,
+                       ALLOWED_HOSTS=['*'])
+    def test_media_js_cached(self):
+        provider = providers.registry.by_id(FacebookProvider.id)
+        scripts = []
+        with patch('allauth.socialaccount.providers.facebook.provider'
+                   '.render_to_string',
+                   wraps=provider_module.render_to_string) as render:
+            # The cache is keyed by site, not by the Host header.
+            for host in ('a.example.com', 'b.example.com'):
+                request = RequestFactory().get(reverse('account_login'),
+                                               HTTP_HOST=host)
+                request.session = {}
+                scripts.append(provider.media_js(request))
+        self.assertEqual(render.call_count, 1)
+        tokens = set()
+        for host, script in zip(('a.example.com', 'b.example.com'),
+                                scripts):
+            self.assertTrue('"appId": "app123id"' in script)
+            fb_data = json.loads(
+                script.split('type="application/json">')[1]
+                .split('</script>')[0])
+            self.assertTrue('loginOptions' in fb_data)
+            self.assertEqual(fb_data['logoutUrl'],
+                             'http://%s/logout/' % host)
+            tokens.add(fb_data['csrfToken'])
+        self.assertEqual(len(tokens), 2)
+
     def test_login_by_token(self):
         resp = self.client.get(reverse('account_login'))
-        with patch('allauth.socialaccount.providers.facebook.views'
-                   '.requests') as requests_mock:
+        with patch('requests.Session.get') as get_mock:
             mocks = [self.get_mocked_response().json()]
-            requests_mock.get.return_value.json \
+            get_mock.return_value.json \
                 = lambda: mocks.pop()
             resp = self.client.post(reverse('facebook_login_by_token'),
                                     data={'access_token': 'dummy'})
@@ -104,11 +133,10 @@ class FacebookTests(OAuth2TestsMixin, TestCase):
         resp = self.client.get(reverse('account_login'))
         nonce = json.loads(
             resp.context['fb_data'])['loginOptions']['auth_nonce']
-        with patch('allauth.socialaccount.providers.facebook.views'
-                   '.requests') as requests_mock:
+        with patch('requests.Session.get') as get_mock:
             mocks = [self.get_mocked_response().json(),
                      {'auth_nonce': nonce}]
-            requests_mock.get.return_value.json \
+            get_mock.return_value.json \
                 = lambda: mocks.pop()
             resp = self.client.post(reverse('facebook_login_by_token'),
                                     data={'access_token': 'dummy'})
@@ -131,3 +159,15 @@ class FacebookTests(OAuth2TestsMixin, TestCase):
     def _login_verified(self):
         self.login(self.get_mocked_response())
         return EmailAddress.objects.get(email='raymond.penners@example.com')
+
+    def test_default_locale_table_shared(self):
+        request = RequestFactory().get('/')
+        with patch.object(locale, '_default_locale_table', None), \
+                patch.object(locale, '_build_locale_table',
+                             wraps=locale._build_locale_table) as build:
+            with translation.override('nl'):
+                for i in range(2):
+                    provider = FacebookProvider(request)
+                    self.assertEqual(
+                        provider.get_locale_for_request(request), 'nl_NL')
+        self.assertEqual(build.call_count, 1)
@@ -7,6 +7,7 @@ from datetime import timedelta
 from django.utils import timezone
 
 from allauth.socialaccount import app_settings, providers
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.helpers import (
     complete_social_login,
     render_authentication_error,
@@ -39,7 +40,7 @@ def compute_appsecret_proof(app, token):
 
 def fb_complete_login(request, app, token):
     provider = providers.registry.by_id(FacebookProvider.id, request)
-    resp = requests.get(
+    resp = get_adapter().get_requests_session().get(
         GRAPH_API_URL + '/me',
         params={
             'fields': ','.join(provider.get_fields()),
@@ -86,7 +87,7 @@ def login_by_token(request):
                 access_token = form.cleaned_data['access_token']
                 expires_at = None
                 if login_options.get('auth_type') == 'reauthenticate':
-                    info = requests.get(
+                    info = get_adapter().get_requests_session().get(
                         GRAPH_API_URL + '/oauth/access_token_info',
                         params={'client_id': app.client_id,
                                 'access_token': access_token}).json()
@@ -95,7 +96,7 @@ def login_by_token(request):
                 else:
                     ok = True
                 if ok and provider.get_settings().get('EXCHANGE_TOKEN'):
-                    resp = requests.get(
+                    resp = get_adapter().get_requests_session().get(
                         GRAPH_API_URL + '/oauth/access_token',
                         params={'grant_type': 'fb_exchange_token',
                                 'client_id': app.client_id,
@@ -1,6 +1,10 @@
+from requests import ConnectionError
+
+from django.test.utils import override_settings
+
 from allauth.socialaccount.models import SocialAccount
 from allauth.socialaccount.tests import OAuth2TestsMixin
-from allauth.tests import MockedResponse, TestCase
+from allauth.tests import MockedResponse, TestCase, patch
 
 from .provider import GitHubProvider
 
@@ -55,3 +59,20 @@ class GitHubTests(OAuth2TestsMixin, TestCase):
         account = socialaccount.get_provider_account()
         self.assertIsNotNone(account.to_str())
         self.assertEqual(account.to_str(), 'pennersr')
+
+    @override_settings(SOCIALACCOUNT_QUERY_EMAIL=True)
+    def test_emails_request_failure(self):
+        """The e-mail addresses are fetched speculatively, so failing to
+        fetch them does not fail the login when the profile has one."""
+        profile = self.get_mocked_response()
+
+        def get(url, **kwargs):
+            if url.endswith('/user/emails'):
+                raise ConnectionError()
+            return profile
+
+        with patch('requests.Session.get', side_effect=get):
+            self.login(profile)
+        socialaccount = SocialAccount.objects.get(uid='201022')
+        self.assertEqual(socialaccount.user.email,
+                         'raymond.penners@intenct.nl')
@@ -1,6 +1,5 @@
-import requests
-
 from allauth.socialaccount import app_settings
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.github.provider import GitHubProvider
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
@@ -27,18 +26,33 @@ class GitHubOAuth2Adapter(OAuth2Adapter):
 
     def complete_login(self, request, app, token, **kwargs):
         params = {'access_token': token.token}
-        resp = requests.get(self.profile_url, params=params)
-        extra_data = resp.json()
-        if app_settings.QUERY_EMAIL and not extra_data.get('email'):
-            extra_data['email'] = self.get_email(token)
+        requests = {'profile': ('GET', self.profile_url, {'params': params})}
+        if app_settings.QUERY_EMAIL:
+            # Fetched along with the profile, as the profile only
+            # contains the e-mail address if the user made it public.
+            requests['emails'] = ('GET', self.emails_url, {'params': params})
+        responses = self.fetch_concurrently(requests, optional=['emails'])
+        extra_data = responses['profile'].json()
+        if 'emails' in responses and not extra_data.get('email'):
+            resp = responses['emails']
+            if isinstance(resp, Exception):
+                # The speculative fetch failed, retry now that it turns
+                # out to be needed.
+                extra_data['email'] = self.get_email(token)
+            else:
+                extra_data['email'] = self.extract_email(resp)
         return self.get_provider().sociallogin_from_response(
             request, extra_data
         )
 
     def get_email(self, token):
-        email = None
         params = {'access_token': token.token}
-        resp = requests.get(self.emails_url, params=params)
+        resp = get_adapter().get_requests_session().get(
+            self.emails_url, params=params)
+        return self.extract_email(resp)
+
+    def extract_email(self, resp):
+        email = None
         emails = resp.json()
         if resp.status_code == 200 and emails:
             email = emails[0]
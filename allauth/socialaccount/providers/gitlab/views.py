@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-import requests
 
 from allauth.socialaccount import app_settings
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.gitlab.provider import GitLabProvider
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
@@ -25,9 +25,9 @@ class GitLabOAuth2Adapter(OAuth2Adapter):
     )
 
     def complete_login(self, request, app, token, response):
-        extra_data = requests.get(self.profile_url, params={
-            'access_token': token.token
-        })
+        extra_data = get_adapter().get_requests_session().get(
+            self.profile_url,
+            params={'access_token': token.token})
 
         return self.get_provider().sociallogin_from_response(
             request,
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.globus.provider import GlobusProvider
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
@@ -19,11 +18,10 @@ class GlobusAdapter(OAuth2Adapter):
     profile_url = '{0}/userinfo'.format(provider_base_url)
 
     def complete_login(self, request, app, token, response):
-        extra_data = requests.get(self.profile_url, params={
-            'access_token': token.token
-        }, headers={
-            'Authorization': 'Bearer ' + token.token,
-        })
+        extra_data = get_adapter().get_requests_session().get(
+            self.profile_url,
+            params={'access_token': token.token},
+            headers={'Authorization': 'Bearer ' + token.token})
 
         return self.get_provider().sociallogin_from_response(
             request,
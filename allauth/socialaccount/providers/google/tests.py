@@ -77,10 +77,8 @@ class GoogleTests(OAuth2TestsMixin, TestCase):
               "code": 401,
               "message": "Invalid Credentials" }
             }""")
-        with patch(
-                'allauth.socialaccount.providers.google.views'
-                '.requests') as patched_requests:
-            patched_requests.get.return_value = response_with_401
+        with patch('requests.Session.get') as patched_get:
+            patched_get.return_value = response_with_401
             with self.assertRaises(HTTPError):
                 adapter.complete_login(request, app, token)
 
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -16,9 +15,10 @@ class GoogleOAuth2Adapter(OAuth2Adapter):
     profile_url = 'https://www.googleapis.com/oauth2/v1/userinfo'
 
     def complete_login(self, request, app, token, **kwargs):
-        resp = requests.get(self.profile_url,
-                            params={'access_token': token.token,
-                                    'alt': 'json'})
+        resp = get_adapter().get_requests_session().get(
+            self.profile_url,
+            params={'access_token': token.token,
+                    'alt': 'json'})
         resp.raise_for_status()
         extra_data = resp.json()
         login = self.get_provider() \
@@ -1,6 +1,5 @@
-import requests
-
 from allauth.socialaccount import app_settings
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.jupyterhub.provider import (
     JupyterHubProvider,
 )
@@ -26,7 +25,8 @@ class JupyterHubAdapter(OAuth2Adapter):
             'Authorization': 'Bearer {0}'.format(access_token)
         }
 
-        extra_data = requests.get(self.profile_url, headers=headers)
+        extra_data = get_adapter().get_requests_session().get(
+            self.profile_url, headers=headers)
 
         user_profile = extra_data.json()
 
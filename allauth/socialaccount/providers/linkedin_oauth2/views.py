@@ -1,5 +1,3 @@
-import requests
-
 from allauth.socialaccount import app_settings
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
@@ -32,16 +30,20 @@ class LinkedInOAuth2Adapter(OAuth2Adapter):
         headers.update(self.get_provider().get_settings().get('HEADERS', {}))
         headers['Authorization'] = ' '.join(['Bearer', token.token])
 
-        info = {}
+        url = self.profile_url + '?projection=(%s)' % ','.join(fields)
+        requests = {'profile': ('GET', url, {'headers': headers})}
         if app_settings.QUERY_EMAIL:
-            resp = requests.get(self.email_url, headers=headers)
-            # If this response goes wrong, that is not a blocker in order to
-            # continue.
-            if resp.ok:
-                info = resp.json()
+            requests['email'] = ('GET', self.email_url, {'headers': headers})
+        responses = self.fetch_concurrently(requests, optional=['email'])
 
-        url = self.profile_url + '?projection=(%s)' % ','.join(fields)
-        resp = requests.get(url, headers=headers)
+        info = {}
+        resp = responses.get('email')
+        # If this response goes wrong, that is not a blocker in order to
+        # continue.
+        if resp is not None and not isinstance(resp, Exception) and resp.ok:
+            info = resp.json()
+
+        resp = responses['profile']
         resp.raise_for_status()
         info.update(resp.json())
         return info
@@ -1,6 +1,6 @@
-import requests
 from hashlib import md5
 
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -26,7 +26,8 @@ class MailRuOAuth2Adapter(OAuth2Adapter):
         data['sig'] = md5(
             (''.join(param_list) + app.secret).encode('utf-8')
         ).hexdigest()
-        response = requests.get(self.profile_url, params=data)
+        response = get_adapter().get_requests_session().get(
+            self.profile_url, params=data)
         extra_data = response.json()[0]
         return self.get_provider().sociallogin_from_response(request,
                                                              extra_data)
@@ -0,0 +1,193 @@
+"""
+Static description of the builtin providers, used by the provider registry
+when `SOCIALACCOUNT_LAZY_PROVIDERS` is enabled so that the provider modules
+do not have to be imported up front.
+
+Maps the provider package to a list of `(id, name, slug, urls)` tuples, where
+`urls` is the kind of `default_urlpatterns()` used by the package (`'oauth'`
+or `'oauth2'`), or `None` if the package ships its own URL patterns.
+
+This needs to be kept in sync with the provider classes (see
+`ProviderManifestTests`).
+"""
+
+PROVIDERS = {
+    'allauth.socialaccount.providers.agave': [
+        ('agave', 'Agave', 'agave', 'oauth2')],
+    'allauth.socialaccount.providers.amazon': [
+        ('amazon', 'Amazon', 'amazon', 'oauth2')],
+    'allauth.socialaccount.providers.angellist': [
+        ('angellist', 'AngelList', 'angellist', 'oauth2')],
+    'allauth.socialaccount.providers.asana': [
+        ('asana', 'Asana', 'asana', 'oauth2')],
+    'allauth.socialaccount.providers.auth0': [
+        ('auth0', 'Auth0', 'auth0', 'oauth2')],
+    'allauth.socialaccount.providers.authentiq': [
+        ('authentiq', 'Authentiq', 'authentiq', 'oauth2')],
+    'allauth.socialaccount.providers.azure': [
+        ('azure', 'Azure', 'azure', 'oauth2')],
+    'allauth.socialaccount.providers.baidu': [
+        ('baidu', 'Baidu', 'baidu', 'oauth2')],
+    'allauth.socialaccount.providers.basecamp': [
+        ('basecamp', 'Basecamp', 'basecamp', 'oauth2')],
+    'allauth.socialaccount.providers.battlenet': [
+        ('battlenet', 'Battle.net', 'battlenet', 'oauth2')],
+    'allauth.socialaccount.providers.bitbucket': [
+        ('bitbucket', 'Bitbucket', 'bitbucket', 'oauth')],
+    'allauth.socialaccount.providers.bitbucket_oauth2': [
+        ('bitbucket_oauth2', 'Bitbucket', 'bitbucket_oauth2', 'oauth')],
+    'allauth.socialaccount.providers.bitly': [
+        ('bitly', 'Bitly', 'bitly', 'oauth2')],
+    'allauth.socialaccount.providers.box': [('box', 'Box', 'box', 'oauth')],
+    'allauth.socialaccount.providers.cern': [
+        ('cern', 'Cern', 'cern', 'oauth2')],
+    'allauth.socialaccount.providers.coinbase': [
+        ('coinbase', 'Coinbase', 'coinbase', 'oauth2')],
+    'allauth.socialaccount.providers.dataporten': [
+        ('dataporten', 'Dataporten', 'dataporten', 'oauth2')],
+    'allauth.socialaccount.providers.daum': [
+        ('Daum', 'Daum', 'Daum', 'oauth2')],
+    'allauth.socialaccount.providers.digitalocean': [
+        ('digitalocean', 'DigitalOcean', 'digitalocean', 'oauth2')],
+    'allauth.socialaccount.providers.discord': [
+        ('discord', 'Discord', 'discord', 'oauth2')],
+    'allauth.socialaccount.providers.disqus': [
+        ('disqus', 'Disqus', 'disqus', 'oauth2')],
+    'allauth.socialaccount.providers.douban': [
+        ('douban', 'Douban', 'douban', 'oauth2')],
+    'allauth.socialaccount.providers.doximity': [
+        ('doximity', 'Doximity', 'doximity', 'oauth2')],
+    'allauth.socialaccount.providers.draugiem': [
+        ('draugiem', 'Draugiem', 'draugiem', None)],
+    'allauth.socialaccount.providers.dropbox': [
+        ('dropbox', 'Dropbox', 'dropbox', 'oauth')],
+    'allauth.socialaccount.providers.dwolla': [
+        ('dwolla', 'Dwolla', 'dwolla', 'oauth2')],
+    'allauth.socialaccount.providers.edmodo': [
+        ('edmodo', 'Edmodo', 'edmodo', 'oauth2')],
+    'allauth.socialaccount.providers.eveonline': [
+        ('eveonline', 'EVE Online', 'eveonline', 'oauth2')],
+    'allauth.socialaccount.providers.evernote': [
+        ('evernote', 'Evernote', 'evernote', 'oauth')],
+    'allauth.socialaccount.providers.eventbrite': [
+        ('eventbrite', 'Eventbrite', 'eventbrite', 'oauth2')],
+    'allauth.socialaccount.providers.facebook': [
+        ('facebook', 'Facebook', 'facebook', None)],
+    'allauth.socialaccount.providers.fake': [
+        ('fake', 'Fake', 'fake', 'oauth2')],
+    'allauth.socialaccount.providers.feedly': [
+        ('feedly', 'Feedly', 'feedly', 'oauth2')],
+    'allauth.socialaccount.providers.fivehundredpx': [
+        ('500px', '500px', '500px', 'oauth')],
+    'allauth.socialaccount.providers.flickr': [
+        ('flickr', 'Flickr', 'flickr', 'oauth')],
+    'allauth.socialaccount.providers.foursquare': [
+        ('foursquare', 'Foursquare', 'foursquare', 'oauth2')],
+    'allauth.socialaccount.providers.fxa': [
+        ('fxa', 'Firefox Accounts', 'fxa', 'oauth2')],
+    'allauth.socialaccount.providers.github': [
+        ('github', 'GitHub', 'github', 'oauth2')],
+    'allauth.socialaccount.providers.gitlab': [
+        ('gitlab', 'GitLab', 'gitlab', 'oauth2')],
+    'allauth.socialaccount.providers.globus': [
+        ('globus', 'Globus', 'globus', 'oauth2')],
+    'allauth.socialaccount.providers.google': [
+        ('google', 'Google', 'google', None)],
+    'allauth.socialaccount.providers.hubic': [
+        ('hubic', 'Hubic', 'hubic', 'oauth2')],
+    'allauth.socialaccount.providers.instagram': [
+        ('instagram', 'Instagram', 'instagram', 'oauth2')],
+    'allauth.socialaccount.providers.jupyterhub': [
+        ('jupyterhub', 'JupyterHub', 'jupyterhub', 'oauth2')],
+    'allauth.socialaccount.providers.kakao': [
+        ('kakao', 'Kakao', 'kakao', 'oauth2')],
+    'allauth.socialaccount.providers.line': [
+        ('line', 'Line', 'line', 'oauth2')],
+    'allauth.socialaccount.providers.linkedin': [
+        ('linkedin', 'LinkedIn', 'linkedin', 'oauth')],
+    'allauth.socialaccount.providers.linkedin_oauth2': [
+        ('linkedin_oauth2', 'LinkedIn', 'linkedin_oauth2', 'oauth2')],
+    'allauth.socialaccount.providers.mailchimp': [
+        ('mailchimp', 'MailChimp', 'mailchimp', 'oauth2')],
+    'allauth.socialaccount.providers.mailru': [
+        ('mailru', 'Mail.RU', 'mailru', 'oauth2')],
+    'allauth.socialaccount.providers.meetup': [
+        ('meetup', 'Meetup', 'meetup', 'oauth2')],
+    'allauth.socialaccount.providers.microsoft': [
+        ('microsoft', 'Microsoft Graph', 'microsoft', 'oauth2')],
+    'allauth.socialaccount.providers.naver': [
+        ('naver', 'Naver', 'naver', 'oauth2')],
+    'allauth.socialaccount.providers.nextcloud': [
+        ('nextcloud', 'NextCloud', 'nextcloud', 'oauth2')],
+    'allauth.socialaccount.providers.odnoklassniki': [
+        ('odnoklassniki', 'Odnoklassniki', 'odnoklassniki', 'oauth2')],
+    'allauth.socialaccount.providers.openid': [
+        ('openid', 'OpenID', 'openid', None)],
+    'allauth.socialaccount.providers.openstreetmap': [
+        ('openstreetmap', 'OpenStreetMap', 'openstreetmap', 'oauth')],
+    'allauth.socialaccount.providers.orcid': [
+        ('orcid', 'Orcid.org', 'orcid', 'oauth2')],
+    'allauth.socialaccount.providers.patreon': [
+        ('patreon', 'Patreon', 'patreon', 'oauth2')],
+    'allauth.socialaccount.providers.paypal': [
+        ('paypal', 'Paypal', 'paypal', 'oauth2')],
+    'allauth.socialaccount.providers.persona': [
+        ('persona', 'Persona', 'persona', None)],
+    'allauth.socialaccount.providers.pinterest': [
+        ('pinterest', 'Pinterest', 'pinterest', 'oauth2')],
+    'allauth.socialaccount.providers.quickbooks': [
+        ('quickbooks', 'QuickBooks', 'quickbooks', 'oauth2')],
+    'allauth.socialaccount.providers.reddit': [
+        ('reddit', 'Reddit', 'reddit', 'oauth2')],
+    'allauth.socialaccount.providers.robinhood': [
+        ('robinhood', 'Robinhood', 'robinhood', 'oauth2')],
+    'allauth.socialaccount.providers.salesforce': [
+        ('salesforce', 'Salesforce', 'salesforce', 'oauth2')],
+    'allauth.socialaccount.providers.sharefile': [
+        ('sharefile', 'ShareFile', 'sharefile', 'oauth2')],
+    'allauth.socialaccount.providers.shopify': [
+        ('shopify', 'Shopify', 'shopify', 'oauth2')],
+    'allauth.socialaccount.providers.slack': [
+        ('slack', 'Slack', 'slack', 'oauth2')],
+    'allauth.socialaccount.providers.soundcloud': [
+        ('soundcloud', 'SoundCloud', 'soundcloud', 'oauth2')],
+    'allauth.socialaccount.providers.spotify': [
+        ('spotify', 'Spotify', 'spotify', 'oauth')],
+    'allauth.socialaccount.providers.stackexchange': [
+        ('stackexchange', 'Stack Exchange', 'stackexchange', 'oauth2')],
+    'allauth.socialaccount.providers.steam': [
+        ('steam', 'Steam', 'steam', None)],
+    'allauth.socialaccount.providers.strava': [
+        ('strava', 'Strava', 'strava', 'oauth2')],
+    'allauth.socialaccount.providers.stripe': [
+        ('stripe', 'Stripe', 'stripe', 'oauth2')],
+    'allauth.socialaccount.providers.telegram': [
+        ('telegram', 'Telegram', 'telegram', None)],
+    'allauth.socialaccount.providers.trello': [
+        ('trello', 'Trello', 'trello', 'oauth')],
+    'allauth.socialaccount.providers.tumblr': [
+        ('tumblr', 'Tumblr', 'tumblr', 'oauth')],
+    'allauth.socialaccount.providers.twentythreeandme': [
+        ('twentythreeandme', '23andMe', '23andme', 'oauth2')],
+    'allauth.socialaccount.providers.twitch': [
+        ('twitch', 'Twitch', 'twitch', 'oauth2')],
+    'allauth.socialaccount.providers.twitter': [
+        ('twitter', 'Twitter', 'twitter', 'oauth')],
+    'allauth.socialaccount.providers.untappd': [
+        ('untappd', 'Untappd', 'untappd', 'oauth2')],
+    'allauth.socialaccount.providers.vimeo': [
+        ('vimeo', 'Vimeo', 'vimeo', 'oauth')],
+    'allauth.socialaccount.providers.vimeo_oauth2': [
+        ('vimeo_oauth2', 'Vimeo', 'vimeo_oauth2', 'oauth2')],
+    'allauth.socialaccount.providers.vk': [('vk', 'VK', 'vk', 'oauth2')],
+    'allauth.socialaccount.providers.weibo': [
+        ('weibo', 'Weibo', 'weibo', 'oauth2')],
+    'allauth.socialaccount.providers.weixin': [
+        ('weixin', 'Weixin', 'weixin', 'oauth2')],
+    'allauth.socialaccount.providers.windowslive': [
+        ('windowslive', 'Live', 'windowslive', 'oauth2')],
+    'allauth.socialaccount.providers.xing': [
+        ('xing', 'Xing', 'xing', 'oauth')],
+    'allauth.socialaccount.providers.yahoo': [
+        ('yahoo', 'Yahoo', 'yahoo', 'oauth2')],
+}
@@ -5,8 +5,6 @@ Inspired by:
     http://github.com/facebook/tornado/blob/master/tornado/auth.py
 """
 
-import requests
-
 from django.http import HttpResponseRedirect
 from django.utils.http import urlencode
 from django.utils.translation import gettext as _
@@ -14,6 +12,7 @@ from django.utils.translation import gettext as _
 from requests_oauthlib import OAuth1
 
 from allauth.compat import parse_qsl, urlparse
+from allauth.socialaccount.adapter import get_adapter
 from allauth.utils import build_absolute_uri, get_request_param
 
 
@@ -72,7 +71,8 @@ class OAuthClient(object):
             rt_url = self.request_token_url + '?' + urlencode(get_params)
             oauth = OAuth1(self.consumer_key,
                            client_secret=self.consumer_secret)
-            response = requests.post(url=rt_url, auth=oauth)
+            response = get_adapter(self.request).get_requests_session().post(
+                url=rt_url, auth=oauth)
             if response.status_code not in [200, 201]:
                 raise OAuthError(
                     _('Invalid response while obtaining request token'
@@ -103,7 +103,8 @@ class OAuthClient(object):
             if oauth_verifier:
                 at_url = at_url + '?' + urlencode(
                     {'oauth_verifier': oauth_verifier})
-            response = requests.post(url=at_url, auth=oauth)
+            response = get_adapter(self.request).get_requests_session().post(
+                url=at_url, auth=oauth)
             if response.status_code not in [200, 201]:
                 raise OAuthError(
                     _('Invalid response while obtaining access token'
@@ -188,10 +189,11 @@ class OAuth(object):
             client_secret=self.secret_key,
             resource_owner_key=access_token['oauth_token'],
             resource_owner_secret=access_token['oauth_token_secret'])
-        response = getattr(requests, method.lower())(url,
-                                                     auth=oauth,
-                                                     headers=headers,
-                                                     params=params)
+        session = get_adapter(self.request).get_requests_session()
+        response = getattr(session, method.lower())(url,
+                                                    auth=oauth,
+                                                    headers=headers,
+                                                    params=params)
         if response.status_code != 200:
             raise OAuthError(
                 _('No access to private resources at "%s".')
@@ -1,14 +1,13 @@
-from django.urls import reverse
 from django.utils.http import urlencode
 
 from allauth.compat import parse_qsl
-from allauth.socialaccount.providers.base import Provider
+from allauth.socialaccount.providers.base import Provider, reverse_login_url
 
 
 class OAuthProvider(Provider):
 
     def get_login_url(self, request, **kwargs):
-        url = reverse(self.id + "_login")
+        url = reverse_login_url(self.id + "_login")
         if kwargs:
             url = url + '?' + urlencode(kwargs)
         return url
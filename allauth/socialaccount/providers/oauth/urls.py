@@ -1,13 +1,16 @@
 from django.conf.urls import include, url
 
-from allauth.utils import import_attribute
+from allauth.socialaccount import app_settings as socialaccount_settings
+from allauth.utils import LazyCallable, import_attribute
 
 
 def default_urlpatterns(provider):
-    login_view = import_attribute(
-        provider.get_package() + '.views.oauth_login')
-    callback_view = import_attribute(
-        provider.get_package() + '.views.oauth_callback')
+    if socialaccount_settings.LAZY_PROVIDERS:
+        get_view = LazyCallable
+    else:
+        get_view = import_attribute
+    login_view = get_view(provider.get_package() + '.views.oauth_login')
+    callback_view = get_view(provider.get_package() + '.views.oauth_callback')
 
     urlpatterns = [
         url('^login/$',
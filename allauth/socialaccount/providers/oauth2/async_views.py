@@ -0,0 +1,99 @@
+"""
+Async variants of the OAuth2 login and callback views, for deployments
+running under ASGI (requires Django 3.1+ and Python 3.5+).
+
+The calls to the provider (the access token exchange and
+`complete_login()`) are performed outside of the thread that handles
+database access, so that a slow identity provider does not tie up that
+thread. Adapters can take this one step further by implementing an
+`async_complete_login()` coroutine, which is awaited instead of
+`complete_login()`.
+"""
+from __future__ import absolute_import
+
+from requests import RequestException
+
+from django.core.exceptions import PermissionDenied
+
+from asgiref.sync import sync_to_async
+
+from allauth.exceptions import ImmediateHttpResponse
+from allauth.socialaccount.helpers import (
+    complete_social_login,
+    render_authentication_error,
+)
+from allauth.socialaccount.models import SocialLogin
+from allauth.socialaccount.providers.base import ProviderException
+from allauth.socialaccount.providers.oauth2.client import OAuth2Error
+from allauth.socialaccount.providers.oauth2.views import (
+    OAuth2CallbackView,
+    OAuth2LoginView,
+    OAuth2View,
+)
+
+
+class AsyncOAuth2View(OAuth2View):
+    @classmethod
+    def adapter_view(cls, adapter):
+        async def view(request, *args, **kwargs):
+            self = cls()
+            self.request = request
+            self.adapter = adapter(request)
+            try:
+                return await self.dispatch(request, *args, **kwargs)
+            except ImmediateHttpResponse as e:
+                return e.response
+        view.adapter_class = adapter
+        return view
+
+
+class AsyncOAuth2LoginView(AsyncOAuth2View):
+    async def dispatch(self, request, *args, **kwargs):
+        # Only database and session access, no calls to the provider.
+        return await sync_to_async(OAuth2LoginView.dispatch)(
+            self, request, *args, **kwargs)
+
+
+class AsyncOAuth2CallbackView(AsyncOAuth2View):
+    async def dispatch(self, request, *args, **kwargs):
+        if 'error' in request.GET or 'code' not in request.GET:
+            return await sync_to_async(OAuth2CallbackView.dispatch)(
+                self, request, *args, **kwargs)
+        app = await sync_to_async(self.adapter.get_provider().get_app)(
+            self.request)
+        client = self.get_client(request, app)
+        try:
+            access_token = await sync_to_async(
+                client.get_access_token,
+                thread_sensitive=False)(request.GET['code'])
+            token = self.adapter.parse_token(access_token)
+            token.app = app
+            login = await self.complete_login(request, app, token,
+                                              response=access_token)
+            login.token = token
+            return await sync_to_async(self.complete_social_login)(
+                request, login)
+        except (PermissionDenied,
+                OAuth2Error,
+                RequestException,
+                ProviderException) as e:
+            return await sync_to_async(render_authentication_error)(
+                request,
+                self.adapter.provider_id,
+                exception=e)
+
+    async def complete_login(self, request, app, token, **kwargs):
+        async_complete_login = getattr(
+            self.adapter, 'async_complete_login', None)
+        if async_complete_login:
+            return await async_complete_login(request, app, token, **kwargs)
+        return await sync_to_async(
+            self.adapter.complete_login,
+            thread_sensitive=False)(request, app, token, **kwargs)
+
+    def complete_social_login(self, request, login):
+        if self.adapter.supports_state:
+            login.state = SocialLogin.parse_and_verify_url_state(request)
+        else:
+            login.state = SocialLogin.unstash_state(request)
+        return complete_social_login(request, login)
@@ -3,6 +3,7 @@ import requests
 from django.utils.http import urlencode
 
 from allauth.compat import parse_qsl
+from allauth.socialaccount.adapter import get_adapter
 
 
 class OAuth2Error(Exception):
@@ -47,6 +48,19 @@ class OAuth2Client(object):
             'redirect_uri': self.callback_url,
             'grant_type': 'authorization_code',
             'code': code}
+        return self._fetch_access_token(data)
+
+    def refresh_access_token(self, refresh_token):
+        """
+        Exchanges `refresh_token` for a new access token (the
+        `refresh_token` grant).
+        """
+        data = {
+            'grant_type': 'refresh_token',
+            'refresh_token': refresh_token}
+        return self._fetch_access_token(data)
+
+    def _fetch_access_token(self, data):
         if self.basic_auth:
             auth = requests.auth.HTTPBasicAuth(
                 self.consumer_key,
@@ -64,7 +78,7 @@ class OAuth2Client(object):
             params = data
             data = None
         # TODO: Proper exception handling
-        resp = requests.request(
+        resp = get_adapter(self.request).get_requests_session().request(
             self.access_token_method,
             url,
             params=params,
@@ -3,7 +3,12 @@ from __future__ import absolute_import, unicode_literals
 
 import json
 import sys
+import threading
+from requests import RequestException
+from unittest import skipIf
 
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import MessageMiddleware
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.contrib.sites.models import Site
 from django.core.exceptions import PermissionDenied
@@ -15,12 +20,21 @@ from django.utils import six
 from django.utils.http import urlunquote_plus as urlunquote
 
 from allauth.compat import parse_qs, urlparse
-from allauth.socialaccount.models import SocialApp
+from allauth.socialaccount.models import SocialAccount, SocialApp
 from allauth.socialaccount.providers.fake.views import FakeOAuth2Adapter
+from allauth.tests import MockedResponse, mocked_response, patch
 
 from .views import MissingParameter, OAuth2LoginView, proxy_login_callback
 
 
+try:
+    from asgiref.sync import async_to_sync
+
+    from .async_views import AsyncOAuth2CallbackView, AsyncOAuth2LoginView
+except (ImportError, SyntaxError):
+    async_to_sync = None
+
+
 class OAuth2TestsMixin(object):
     def param(self, param, url):
         # Look for a redirect uri
@@ -179,3 +193,92 @@ class OAuth2TestsIsProxy(OAuth2TestsMixin, TestCase):
                 request,
                 callback_view_name='fake_callback',
             )
+
+
+class OAuth2AdapterFetchTests(TestCase):
+    def setUp(self):
+        super(OAuth2AdapterFetchTests, self).setUp()
+        self.adapter = FakeOAuth2Adapter(RequestFactory().get('/'))
+
+    def test_fetch_concurrently(self):
+        fetched = {'profile': threading.Event(), 'emails': threading.Event()}
+
+        def get(url, **kwargs):
+            fetched[url].set()
+            # Only completes if the other request is in flight as well.
+            other = 'emails' if url == 'profile' else 'profile'
+            concurrent = fetched[other].wait(5)
+            return MockedResponse(200, json.dumps({'concurrent': concurrent,
+                                                   'url': url}))
+
+        with patch('requests.Session.get', side_effect=get):
+            responses = self.adapter.fetch_concurrently({
+                'profile': ('GET', 'profile', {}),
+                'emails': ('GET', 'emails', {})})
+        self.assertEqual(responses['profile'].json(),
+                         {'concurrent': True, 'url': 'profile'})
+        self.assertEqual(responses['emails'].json(),
+                         {'concurrent': True, 'url': 'emails'})
+
+    def test_fetch_concurrently_raises(self):
+        def get(url, **kwargs):
+            if url == 'emails':
+                raise RequestException()
+            return MockedResponse(200, '{}')
+
+        with patch('requests.Session.get', side_effect=get):
+            with self.assertRaises(RequestException):
+                self.adapter.fetch_concurrently({
+                    'profile': ('GET', 'profile', {}),
+                    'emails': ('GET', 'emails', {})})
+            responses = self.adapter.fetch_concurrently({
+                'profile': ('GET', 'profile', {}),
+                'emails': ('GET', 'emails', {})}, optional=['emails'])
+        self.assertEqual(responses['profile'].json(), {})
+        self.assertIsInstance(responses['emails'], RequestException)
+
+
+@skipIf(async_to_sync is None, 'Async views require asgiref')
+@override_settings(SOCIALACCOUNT_AUTO_SIGNUP=True)
+class AsyncOAuth2ViewTests(OAuth2TestsMixin, TestCase):
+    def init_request(self, endpoint, params, session=None):
+        request = super(AsyncOAuth2ViewTests, self).init_request(
+            endpoint, params)
+        if session is not None:
+            request.session = session
+        request.user = AnonymousUser()
+        MessageMiddleware().process_request(request)
+        return request
+
+    def test_login_and_callback(self):
+        request = self.init_request('fake_login', dict(process='login'))
+        login_view = AsyncOAuth2LoginView.adapter_view(FakeOAuth2Adapter)
+        resp = async_to_sync(login_view)(request)
+        self.assertEqual(resp.status_code, 302)
+        state = self.param('state', resp['location'])
+
+        request = self.init_request('fake_callback',
+                                    dict(code='test', state=state),
+                                    session=request.session)
+        callback_view = AsyncOAuth2CallbackView.adapter_view(
+            FakeOAuth2Adapter)
+        with mocked_response(
+                MockedResponse(200, '{"access_token": "testac"}',
+                               {'content-type': 'application/json'}),
+                MockedResponse(200, json.dumps({
+                    'id': '123',
+                    'email': 'raymond@example.com',
+                    'given_name': 'Raymond'}))):
+            resp = async_to_sync(callback_view)(request)
+        self.assertEqual(resp.status_code, 302)
+        account = SocialAccount.objects.get(provider='fake', uid='123')
+        self.assertEqual(account.user.first_name, 'Raymond')
+
+    def test_callback_error(self):
+        request = self.init_request('fake_callback',
+                                    dict(error='access_denied'))
+        callback_view = AsyncOAuth2CallbackView.adapter_view(
+            FakeOAuth2Adapter)
+        resp = async_to_sync(callback_view)(request)
+        self.assertEqual(resp['location'],
+                         reverse('socialaccount_login_cancelled'))
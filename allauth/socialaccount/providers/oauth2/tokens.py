@@ -0,0 +1,127 @@
+"""
+Refreshing of OAuth2 access tokens that are about to expire, using the
+`refresh_token` grant. The refresh token is the one stored in
+`SocialToken.token_secret`.
+
+Concurrent refreshes of the same token (e.g. by several processes that all
+notice that it is about to expire) are serialized using a lock kept in the
+Django cache: only one of them calls the provider, the others wait for it
+and then use the refreshed token. Use a cache that is shared between
+processes for this to hold across processes.
+"""
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from allauth.socialaccount import providers
+from allauth.utils import import_attribute
+
+from .client import OAuth2Client, OAuth2Error
+from .provider import OAuth2Provider
+
+
+def get_adapter_class(provider):
+    """
+    Returns the `OAuth2Adapter` subclass used by the views of `provider`.
+    Some OAuth2 providers (e.g. Dropbox, Spotify) use the OAuth URL
+    patterns, and therefore name their login view `oauth_login`.
+    """
+    for name in ('oauth2_login', 'oauth_login'):
+        try:
+            view = import_attribute(
+                provider.get_package() + '.views.' + name)
+            return view.adapter_class
+        except (ImportError, AttributeError):
+            pass
+    raise OAuth2Error('Unable to refresh tokens for provider %s'
+                      % provider.id)
+
+
+class OAuth2TokenManager(object):
+    """
+    Hands out access tokens, refreshing the ones that expire within
+    `margin` seconds.
+    """
+    lock_timeout = 30
+    poll_interval = 0.1
+
+    def __init__(self, request=None, margin=60):
+        self.request = request
+        self.margin = timedelta(seconds=margin)
+
+    def is_expiring(self, token):
+        return (token.expires_at is not None and
+                token.expires_at <= timezone.now() + self.margin)
+
+    def get_token(self, token):
+        """
+        Returns `token`, after refreshing it if it is about to expire (and
+        can be refreshed).
+        """
+        if token.token_secret and self.is_expiring(token):
+            self.refresh(token)
+        return token
+
+    def get_lock_key(self, token):
+        return 'allauth.socialtoken.refresh.%s' % token.pk
+
+    def refresh(self, token):
+        """
+        Refreshes `token` in place, unless it has been refreshed by someone
+        else in the meantime.
+        """
+        key = self.get_lock_key(token)
+        lock = get_random_string(32)
+        access_token = token.token
+        if not cache.add(key, lock, self.lock_timeout):
+            self.wait_for_lock(key)
+            token.refresh_from_db()
+            return token
+        try:
+            token.refresh_from_db()
+            if token.token == access_token:
+                self.refresh_token(token)
+        finally:
+            # Once `lock_timeout` has passed, the lock may have been taken
+            # over by someone else.
+            if cache.get(key) == lock:
+                cache.delete(key)
+        return token
+
+    def wait_for_lock(self, key):
+        deadline = time.time() + self.lock_timeout
+        while cache.get(key) is not None and time.time() < deadline:
+            time.sleep(self.poll_interval)
+
+    def refresh_token(self, token):
+        """
+        Exchanges the refresh token of `token` for a new access token at the
+        `access_token_url` of the provider, and saves it.
+        """
+        provider = providers.registry.by_id(token.account.provider,
+                                            self.request)
+        if not isinstance(provider, OAuth2Provider):
+            raise OAuth2Error('Unable to refresh tokens for provider %s'
+                              % provider.id)
+        adapter = get_adapter_class(provider)(self.request)
+        app = token.app
+        client = OAuth2Client(self.request, app.client_id, app.secret,
+                              adapter.access_token_method,
+                              adapter.access_token_url,
+                              None,
+                              [],
+                              scope_delimiter=adapter.scope_delimiter,
+                              headers=adapter.headers,
+                              basic_auth=adapter.basic_auth)
+        new_token = adapter.parse_token(
+            client.refresh_access_token(token.token_secret))
+        token.token = new_token.token
+        # Not all providers hand out a new refresh token.
+        if new_token.token_secret:
+            token.token_secret = new_token.token_secret
+        token.expires_at = new_token.expires_at
+        token.save(update_fields=['token', 'token_secret', 'expires_at'])
+        return token
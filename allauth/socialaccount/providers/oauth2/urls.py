@@ -1,15 +1,18 @@
 from django.conf.urls import include, url
 
 from allauth.account import app_settings
+from allauth.socialaccount import app_settings as socialaccount_settings
 from allauth.socialaccount.providers.oauth2.views import proxy_login_callback
-from allauth.utils import import_attribute
+from allauth.utils import LazyCallable, import_attribute
 
 
 def default_urlpatterns(provider):
-    login_view = import_attribute(
-        provider.get_package() + '.views.oauth2_login')
-    callback_view = import_attribute(
-        provider.get_package() + '.views.oauth2_callback')
+    if socialaccount_settings.LAZY_PROVIDERS:
+        get_view = LazyCallable
+    else:
+        get_view = import_attribute
+    login_view = get_view(provider.get_package() + '.views.oauth2_login')
+    callback_view = get_view(provider.get_package() + '.views.oauth2_callback')
 
     urlpatterns = [
         url(r'^login/$', login_view, name=provider.id + "_login"),
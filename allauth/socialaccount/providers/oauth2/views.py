@@ -1,5 +1,6 @@
 from __future__ import absolute_import
 
+import threading
 from datetime import timedelta
 from requests import RequestException
 
@@ -12,6 +13,7 @@ from allauth.account import app_settings
 from allauth.compat import urljoin, urlparse
 from allauth.exceptions import ImmediateHttpResponse
 from allauth.socialaccount import providers
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.helpers import (
     complete_social_login,
     render_authentication_error,
@@ -53,6 +55,46 @@ class OAuth2Adapter(object):
         """
         raise NotImplementedError
 
+    def fetch_concurrently(self, requests, optional=()):
+        """
+        Performs a number of mutually independent requests to the provider
+        concurrently, so that fetching e.g. the profile and the e-mail
+        addresses takes as long as the slowest of the requests, instead of
+        their sum.
+
+        `requests` is a dictionary mapping a key to a `(method, url,
+        kwargs)` tuple. Returns a dictionary mapping each key to its
+        response. If any of the requests fails, its exception is raised,
+        unless its key is listed in `optional`: the exception is then
+        returned in place of the response.
+        """
+        session = get_adapter(self.request).get_requests_session()
+        results = {}
+
+        def fetch(key, method, url, kwargs):
+            try:
+                results[key] = getattr(session, method.lower())(url,
+                                                                **kwargs)
+            except Exception as e:
+                results[key] = e
+
+        items = list(requests.items())
+        if not items:
+            return results
+        threads = [
+            threading.Thread(target=fetch, args=(key,) + tuple(spec))
+            for key, spec in items[1:]]
+        for thread in threads:
+            thread.start()
+        # The first request is performed by the current thread.
+        fetch(items[0][0], *items[0][1])
+        for thread in threads:
+            thread.join()
+        for key, _ in items:
+            if isinstance(results[key], Exception) and key not in optional:
+                raise results[key]
+        return results
+
     def get_callback_url(self, request, app):
         callback_url = reverse(self.provider_id + "_callback")
         protocol = self.redirect_uri_protocol
@@ -79,6 +121,7 @@ class OAuth2View(object):
                 return self.dispatch(request, *args, **kwargs)
             except ImmediateHttpResponse as e:
                 return e.response
+        view.adapter_class = adapter
         return view
 
     def get_client(self, request, app):
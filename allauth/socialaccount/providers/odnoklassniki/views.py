@@ -1,6 +1,6 @@
-import requests
 from hashlib import md5
 
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -53,7 +53,8 @@ class OdnoklassnikiOAuth2Adapter(OAuth2Adapter):
         data['sig'] = md5(
             (''.join(check_list) + suffix).encode('utf-8')).hexdigest()
 
-        response = requests.get(self.profile_url, params=data)
+        response = get_adapter().get_requests_session().get(
+            self.profile_url, params=data)
         extra_data = response.json()
         return self.get_provider().sociallogin_from_response(request,
                                                              extra_data)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Q
+from django.db.models.functions import Length
+
+
+def delete_long_rows(apps, schema_editor):
+    # Associations and nonces are short lived, and can simply be dropped
+    # when they do not fit within the shortened columns.
+    OpenIDStore = apps.get_model('openid', 'OpenIDStore')
+    OpenIDStore.objects.annotate(
+        server_url_length=Length('server_url'),
+        handle_length=Length('handle')).filter(
+            Q(server_url_length__gt=191) | Q(handle_length__gt=191)).delete()
+    OpenIDNonce = apps.get_model('openid', 'OpenIDNonce')
+    OpenIDNonce.objects.annotate(
+        server_url_length=Length('server_url'),
+        salt_length=Length('salt')).filter(
+            Q(server_url_length__gt=191) | Q(salt_length__gt=40)).delete()
+
+
+def delete_duplicate_nonces(apps, schema_editor):
+    OpenIDNonce = apps.get_model('openid', 'OpenIDNonce')
+    duplicates = OpenIDNonce.objects.values(
+        'server_url', 'timestamp', 'salt').annotate(
+            min_pk=Min('pk'), count=Count('pk')).filter(count__gt=1)
+    for duplicate in duplicates:
+        OpenIDNonce.objects.filter(
+            server_url=duplicate['server_url'],
+            timestamp=duplicate['timestamp'],
+            salt=duplicate['salt']).exclude(
+                pk=duplicate['min_pk']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openid', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_long_rows, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='openidnonce',
+            name='salt',
+            field=models.CharField(max_length=40),
+        ),
+        migrations.AlterField(
+            model_name='openidnonce',
+            name='server_url',
+            field=models.CharField(max_length=191),
+        ),
+        migrations.AlterField(
+            model_name='openidstore',
+            name='handle',
+            field=models.CharField(max_length=191),
+        ),
+        migrations.AlterField(
+            model_name='openidstore',
+            name='server_url',
+            field=models.CharField(max_length=191),
+        ),
+        migrations.RunPython(
+            delete_duplicate_nonces, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='openidnonce',
+            unique_together=set([('server_url', 'timestamp', 'salt')]),
+        ),
+        migrations.AddIndex(
+            model_name='openidstore',
+            index=models.Index(fields=['server_url', 'handle'], name='openid_store_server_handle'),
+        ),
+    ]
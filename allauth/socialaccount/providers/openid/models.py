@@ -5,23 +5,34 @@ from allauth.compat import python_2_unicode_compatible
 
 @python_2_unicode_compatible
 class OpenIDStore(models.Model):
-    server_url = models.CharField(max_length=255)
-    handle = models.CharField(max_length=255)
+    # Indexed columns are capped at 191 characters, which fit within the
+    # key limit of MySQL when using utf8mb4.
+    server_url = models.CharField(max_length=191)
+    handle = models.CharField(max_length=191)
     secret = models.TextField()
     issued = models.IntegerField()
     lifetime = models.IntegerField()
     assoc_type = models.TextField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['server_url', 'handle'],
+                         name='openid_store_server_handle'),
+        ]
+
     def __str__(self):
         return self.server_url
 
 
 @python_2_unicode_compatible
 class OpenIDNonce(models.Model):
-    server_url = models.CharField(max_length=255)
+    server_url = models.CharField(max_length=191)
     timestamp = models.IntegerField()
-    salt = models.CharField(max_length=255)
+    salt = models.CharField(max_length=40)
     date_created = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        unique_together = [('server_url', 'timestamp', 'salt')]
+
     def __str__(self):
         return self.server_url
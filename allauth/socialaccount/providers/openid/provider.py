@@ -1,8 +1,11 @@
-from django.urls import reverse
 from django.utils.http import urlencode
 
 from allauth.compat import urlparse
-from allauth.socialaccount.providers.base import Provider, ProviderAccount
+from allauth.socialaccount.providers.base import (
+    Provider,
+    ProviderAccount,
+    reverse_login_url,
+)
 
 from .utils import (
     AXAttribute,
@@ -41,7 +44,7 @@ class OpenIDProvider(Provider):
     account_class = OpenIDAccount
 
     def get_login_url(self, request, **kwargs):
-        url = reverse('openid_login')
+        url = reverse_login_url('openid_login')
         if kwargs:
             url += '?' + urlencode(kwargs)
         return url
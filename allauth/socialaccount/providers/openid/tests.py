@@ -1,14 +1,31 @@
+import base64
+import json
+import pickle
+import time
+
 from django.test import override_settings
 from django.urls import reverse
 
+from openid.association import Association
 from openid.consumer import consumer
+from openid.consumer.discover import OPENID_2_0_TYPE, OpenIDServiceEndpoint
+from openid.yadis.manager import YadisServiceManager
 
+from allauth.socialaccount import providers
 from allauth.socialaccount.models import SocialAccount
 from allauth.tests import Mock, TestCase, patch
 from allauth.utils import get_user_model
 
 from . import views
-from .utils import AXAttribute
+from .models import OpenIDStore
+from .utils import (
+    AXAttribute,
+    CacheOpenIDStore,
+    DBOpenIDStore,
+    JSONSafeSession,
+    get_cached_discover,
+    get_openid_store,
+)
 
 
 class OpenIDTests(TestCase):
@@ -104,3 +121,116 @@ class OpenIDTests(TestCase):
                         SocialAccount.objects.get(user__first_name='raymond')
                     self.assertEqual(
                         socialaccount.extra_data.get('phone'), '123456789')
+
+
+class DBOpenIDStoreTests(TestCase):
+
+    def test_use_nonce(self):
+        store = DBOpenIDStore()
+        self.assertTrue(store.useNonce('https://example.com', 1, 'salt'))
+        self.assertFalse(store.useNonce('https://example.com', 1, 'salt'))
+        self.assertTrue(store.useNonce('https://example.com', 1, 'pepper'))
+
+    def test_long_values(self):
+        store = DBOpenIDStore()
+        server_url = 'https://example.com/' + 'x' * 300
+        salt = 's' * 255
+        self.assertTrue(store.useNonce(server_url, 1, salt))
+        self.assertFalse(store.useNonce(server_url, 1, salt))
+        self.assertTrue(store.useNonce(server_url, 1, salt[:-1] + 't'))
+        assoc = Association.fromExpiresIn(
+            3600, 'handle', b'secret', 'HMAC-SHA1')
+        store.storeAssociation(server_url, assoc)
+        self.assertEqual(
+            OpenIDStore.objects.get(
+                server_url=store.get_server_url_key(server_url)).handle,
+            'handle')
+        store.removeAssociation(server_url, 'handle')
+        self.assertFalse(OpenIDStore.objects.exists())
+        # Too long to store, the consumer falls back to stateless mode.
+        store.storeAssociation(
+            'https://example.com',
+            Association.fromExpiresIn(
+                3600, 'h' * 255, b'secret', 'HMAC-SHA1'))
+        self.assertFalse(OpenIDStore.objects.exists())
+
+
+class CacheOpenIDStoreTests(TestCase):
+
+    def setUp(self):
+        self.store = CacheOpenIDStore()
+        self.store.cache.clear()
+
+    def test_use_nonce(self):
+        now = int(time.time())
+        self.assertTrue(self.store.useNonce('https://example.com', now, 's'))
+        self.assertFalse(self.store.useNonce('https://example.com', now, 's'))
+        self.assertFalse(
+            self.store.useNonce('https://example.com', now - 86400, 't'))
+
+    def test_associations(self):
+        server_url = 'https://example.com'
+        old = Association.fromExpiresIn(3600, 'old', b'0' * 20, 'HMAC-SHA1')
+        new = Association.fromExpiresIn(3600, 'new', b'1' * 20, 'HMAC-SHA1')
+        self.store.storeAssociation(server_url, old)
+        self.store.storeAssociation(server_url, new)
+        self.assertEqual(self.store.getAssociation(server_url), new)
+        self.assertEqual(self.store.getAssociation(server_url, 'old'), old)
+        self.assertTrue(self.store.removeAssociation(server_url, 'new'))
+        self.assertIsNone(self.store.getAssociation(server_url))
+        self.assertFalse(self.store.removeAssociation(server_url, 'new'))
+
+    @override_settings(SOCIALACCOUNT_PROVIDERS={'openid': {
+        'STORE': 'allauth.socialaccount.providers.openid.utils'
+                 '.CacheOpenIDStore'}})
+    def test_store_setting(self):
+        provider = providers.registry.by_id('openid')
+        self.assertIsInstance(get_openid_store(provider), CacheOpenIDStore)
+
+
+class CachedDiscoverTests(TestCase):
+
+    def test_discovery_cached(self):
+        services = ['service']
+        cached_discover = get_cached_discover(60)
+        with patch('allauth.socialaccount.providers.openid.utils'
+                   '.discover') as discover:
+            discover.return_value = ('http://discover.example.com/', services)
+            for uri in ('discover.example.com',
+                        'http://DISCOVER.example.com/#fragment'):
+                self.assertEqual(
+                    cached_discover(uri),
+                    ('http://discover.example.com/', services))
+        discover.assert_called_once_with('discover.example.com')
+
+
+class JSONSafeSessionTests(TestCase):
+
+    def test_yadis_manager_round_trip(self):
+        endpoints = []
+        for i in range(2):
+            endpoint = OpenIDServiceEndpoint()
+            endpoint.claimed_id = 'http://me.example.com/%d' % i
+            endpoint.server_url = 'http://server.example.com/'
+            endpoint.type_uris = [OPENID_2_0_TYPE]
+            endpoint.used_yadis = True
+            endpoints.append(endpoint)
+        manager = YadisServiceManager(
+            'me.example.com', 'http://me.example.com/', endpoints, 'key')
+        next(manager)
+        session = {}
+        JSONSafeSession(session)['manager'] = manager
+        self.assertEqual(json.loads(json.dumps(session)), session)
+        restored = JSONSafeSession(session)['manager']
+        self.assertEqual(restored.starting_url, 'me.example.com')
+        self.assertEqual(restored.session_key, 'key')
+        self.assertEqual(restored._current.claimed_id,
+                         'http://me.example.com/0')
+        self.assertEqual([s.claimed_id for s in restored.services],
+                         ['http://me.example.com/1'])
+        self.assertEqual(restored.services[0].type_uris, [OPENID_2_0_TYPE])
+
+    def test_legacy_pickled_value(self):
+        session = {'key': base64.b64encode(
+            pickle.dumps('value')).decode('ascii')}
+        self.assertEqual(JSONSafeSession(session)['key'], 'value')
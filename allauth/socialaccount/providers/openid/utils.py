@@ -1,34 +1,99 @@
 import base64
+import hashlib
 import pickle
+import time
+
+from django.core.cache import cache, caches
+from django.db import IntegrityError, transaction
 
 from openid.association import Association as OIDAssociation
+from openid.consumer.discover import (
+    OpenIDServiceEndpoint,
+    discover,
+    normalizeURL,
+)
 from openid.extensions.ax import FetchResponse
 from openid.extensions.sreg import SRegResponse
+from openid.store import nonce
 from openid.store.interface import OpenIDStore as OIDStore
+from openid.yadis import xri
+from openid.yadis.manager import YadisServiceManager
 
-from allauth.compat import UserDict
-from allauth.utils import valid_email_or_none
+from allauth.compat import UserDict, urlparse
+from allauth.utils import import_callable, valid_email_or_none
 
 from .models import OpenIDNonce, OpenIDStore
 
 
+# Short keys for the `OpenIDServiceEndpoint` attributes stored in the
+# session.
+ENDPOINT_FIELDS = (
+    ('c', 'claimed_id'),
+    ('s', 'server_url'),
+    ('t', 'type_uris'),
+    ('l', 'local_id'),
+    ('i', 'canonicalID'),
+    ('y', 'used_yadis'),
+    ('d', 'display_identifier'),
+)
+
+
+def serialize_endpoint(endpoint):
+    if endpoint is None:
+        return None
+    return dict((key, getattr(endpoint, attr))
+                for key, attr in ENDPOINT_FIELDS)
+
+
+def deserialize_endpoint(data):
+    if data is None:
+        return None
+    endpoint = OpenIDServiceEndpoint()
+    for key, attr in ENDPOINT_FIELDS:
+        setattr(endpoint, attr, data[key])
+    return endpoint
+
+
 class JSONSafeSession(UserDict):
     """
     openid puts e.g. class OpenIDServiceEndpoint in the session.
     Django 1.6 no longer pickles stuff, so we'll need to do some
-    hacking here...
+    hacking here: the endpoints and Yadis service managers are stored
+    as compact JSON, anything else is pickled.
     """
     def __init__(self, session):
         UserDict.__init__(self)
         self.data = session
 
     def __setitem__(self, key, value):
-        data = base64.b64encode(pickle.dumps(value)).decode('ascii')
+        if isinstance(value, OpenIDServiceEndpoint):
+            data = {'e': serialize_endpoint(value)}
+        elif isinstance(value, YadisServiceManager):
+            data = {'m': {
+                'su': value.starting_url,
+                'yu': value.yadis_url,
+                's': [serialize_endpoint(s) for s in value.services],
+                'k': value.session_key,
+                'c': serialize_endpoint(value._current),
+            }}
+        else:
+            data = base64.b64encode(pickle.dumps(value)).decode('ascii')
         return UserDict.__setitem__(self, key, data)
 
     def __getitem__(self, key):
         data = UserDict.__getitem__(self, key)
-        return pickle.loads(base64.b64decode(data.encode('ascii')))
+        if not isinstance(data, dict):
+            return pickle.loads(base64.b64decode(data.encode('ascii')))
+        if 'e' in data:
+            return deserialize_endpoint(data['e'])
+        data = data['m']
+        manager = YadisServiceManager(
+            data['su'],
+            data['yu'],
+            [deserialize_endpoint(s) for s in data['s']],
+            data['k'])
+        manager._current = deserialize_endpoint(data['c'])
+        return manager
 
 
 class OldAXAttribute:
@@ -66,9 +131,24 @@ SRegFields = [
 ]
 
 
+def shorten(value, max_length):
+    """
+    Returns `value` if it fits within `max_length` characters, and a
+    (deterministic) shortened version ending in a hash of `value` otherwise.
+    """
+    if len(value) <= max_length:
+        return value
+    digest = hashlib.sha1(value.encode('utf-8')).hexdigest()
+    return value[:max_length - len(digest)] + digest
+
+
 class DBOpenIDStore(OIDStore):
     max_nonce_age = 6 * 60 * 60
 
+    def get_server_url_key(self, server_url):
+        return shorten(server_url,
+                       OpenIDStore._meta.get_field('server_url').max_length)
+
     def storeAssociation(self, server_url, assoc=None):
         try:
             secret = base64.encodebytes(assoc.secret)
@@ -77,8 +157,13 @@ class DBOpenIDStore(OIDStore):
             secret = base64.encodestring(assoc.secret)
         else:
             secret = secret.decode()
+        if len(assoc.handle) > OpenIDStore._meta.get_field(
+                'handle').max_length:
+            # Not storing the association makes the consumer fall back to
+            # stateless mode.
+            return
         OpenIDStore.objects.create(
-            server_url=server_url,
+            server_url=self.get_server_url_key(server_url),
             handle=assoc.handle,
             secret=secret,
             issued=assoc.issued,
@@ -88,15 +173,12 @@ class DBOpenIDStore(OIDStore):
 
     def getAssociation(self, server_url, handle=None):
         stored_assocs = OpenIDStore.objects.filter(
-            server_url=server_url
+            server_url=self.get_server_url_key(server_url)
         )
         if handle:
             stored_assocs = stored_assocs.filter(handle=handle)
 
-        stored_assocs.order_by('-issued')
-
-        if stored_assocs.count() == 0:
-            return None
+        stored_assocs = stored_assocs.order_by('-issued')
 
         return_val = None
 
@@ -123,7 +205,7 @@ class DBOpenIDStore(OIDStore):
 
     def removeAssociation(self, server_url, handle):
         stored_assocs = OpenIDStore.objects.filter(
-            server_url=server_url
+            server_url=self.get_server_url_key(server_url)
         )
         if handle:
             stored_assocs = stored_assocs.filter(handle=handle)
@@ -131,21 +213,126 @@ class DBOpenIDStore(OIDStore):
         stored_assocs.delete()
 
     def useNonce(self, server_url, timestamp, salt):
+        # Relies on the unique constraint to detect nonces already used.
         try:
-            OpenIDNonce.objects.get(
-                server_url=server_url,
-                timestamp=timestamp,
-                salt=salt
-            )
-        except OpenIDNonce.DoesNotExist:
-            OpenIDNonce.objects.create(
-                server_url=server_url,
-                timestamp=timestamp,
-                salt=salt
-            )
-            return True
+            with transaction.atomic():
+                OpenIDNonce.objects.create(
+                    server_url=self.get_server_url_key(server_url),
+                    timestamp=timestamp,
+                    salt=shorten(
+                        salt,
+                        OpenIDNonce._meta.get_field('salt').max_length)
+                )
+        except IntegrityError:
+            return False
+        return True
+
+
+class CacheOpenIDStore(OIDStore):
+    """
+    Keeps the associations and nonces in the Django cache (`cache_alias`)
+    instead of in the database.
+    """
+    cache_alias = 'default'
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _key(self, kind, *parts):
+        digest = hashlib.sha256(
+            '\n'.join(parts).encode('utf8')).hexdigest()
+        return 'allauth/openid/{0}:{1}'.format(kind, digest)
+
+    def _get_expires_in(self, assoc):
+        # See:
+        # necaris/python3-openid@1abb155c8fc7b508241cbe9d2cae24f18e4a379b
+        if hasattr(assoc, 'getExpiresIn'):
+            return assoc.getExpiresIn()
+        return assoc.expiresIn
 
-        return False
+    def storeAssociation(self, server_url, assoc=None):
+        timeout = self._get_expires_in(assoc)
+        data = assoc.serialize()
+        self.cache.set_many({
+            self._key('assoc', server_url, assoc.handle): data,
+            # The most recently issued association, see getAssociation().
+            self._key('assoc', server_url): data,
+        }, timeout)
+
+    def getAssociation(self, server_url, handle=None):
+        if handle:
+            key = self._key('assoc', server_url, handle)
+        else:
+            key = self._key('assoc', server_url)
+        data = self.cache.get(key)
+        if data is None:
+            return None
+        assoc = OIDAssociation.deserialize(data)
+        if self._get_expires_in(assoc) == 0:
+            return None
+        return assoc
+
+    def removeAssociation(self, server_url, handle):
+        key = self._key('assoc', server_url, handle)
+        found = self.cache.get(key) is not None
+        self.cache.delete(key)
+        latest_key = self._key('assoc', server_url)
+        latest = self.cache.get(latest_key)
+        if latest and OIDAssociation.deserialize(latest).handle == handle:
+            self.cache.delete(latest_key)
+        return found
+
+    def useNonce(self, server_url, timestamp, salt):
+        if abs(timestamp - time.time()) > nonce.SKEW:
+            return False
+        # `add()` only succeeds for nonces not seen before.
+        return self.cache.add(
+            self._key('nonce', server_url, str(timestamp), salt),
+            1,
+            nonce.SKEW * 2)
+
+
+def normalize_identifier(identifier):
+    """
+    Normalizes an OpenID identifier the way `discover()` does.
+    """
+    if xri.identifierScheme(identifier) == 'XRI':
+        return identifier
+    parsed = urlparse(identifier)
+    if not (parsed[0] and parsed[1]):
+        identifier = 'http://' + identifier
+    return normalizeURL(identifier)
+
+
+def get_cached_discover(timeout):
+    """
+    Returns a drop-in replacement for `openid.consumer.discover.discover()`
+    that caches the discovered services for `timeout` seconds, keyed by
+    normalized identifier.
+    """
+    def cached_discover(uri):
+        key = 'allauth/openid/discover:{0}'.format(hashlib.sha256(
+            normalize_identifier(uri).encode('utf8')).hexdigest())
+        result = cache.get(key)
+        if result is None:
+            result = discover(uri)
+            claimed_id, services = result
+            if services:
+                cache.set(key, result, timeout)
+        return result
+    return cached_discover
+
+
+def get_openid_store(provider):
+    """
+    Returns the OpenID store configured by the `STORE` setting of the
+    provider, defaulting to `DBOpenIDStore`.
+    """
+    store_class = provider.get_settings().get('STORE')
+    if store_class:
+        return import_callable(store_class)()
+    return DBOpenIDStore()
 
 
 def get_email_from_response(response):
@@ -20,12 +20,26 @@ from allauth.socialaccount.models import SocialLogin
 from ..base import AuthError
 from .forms import LoginForm
 from .provider import OpenIDProvider
-from .utils import AXAttributes, DBOpenIDStore, JSONSafeSession, SRegFields
+from .utils import (
+    AXAttributes,
+    JSONSafeSession,
+    SRegFields,
+    get_cached_discover,
+    get_openid_store,
+)
 
 
-def _openid_consumer(request):
-    store = DBOpenIDStore()
+def _openid_consumer(request, provider_class=OpenIDProvider):
+    provider = providers.registry.by_id(provider_class.id, request)
+    store = get_openid_store(provider)
     client = consumer.Consumer(JSONSafeSession(request.session), store)
+    discovery_cache_timeout = provider.get_settings().get(
+        'DISCOVERY_CACHE_TIMEOUT')
+    if discovery_cache_timeout:
+        # Discovery happens both when starting the login, and when verifying
+        # the response.
+        client._discover = client.consumer._discover = get_cached_discover(
+            discovery_cache_timeout)
     return client
 
 
@@ -70,7 +84,7 @@ class OpenIDLoginView(View):
         ))
 
     def get_client(self):
-        return _openid_consumer(self.request)
+        return _openid_consumer(self.request, self.provider)
 
     def get_realm(self, provider):
         return provider.get_settings().get(
@@ -158,7 +172,7 @@ class OpenIDCallbackView(View):
         )
 
     def get_client(self):
-        return _openid_consumer(self.request)
+        return _openid_consumer(self.request, self.provider)
 
     def get_openid_response(self, client):
         return client.complete(
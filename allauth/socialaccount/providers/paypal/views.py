@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -36,7 +35,7 @@ class PaypalOAuth2Adapter(OAuth2Adapter):
             return 'sandbox.paypal.com'
 
     def complete_login(self, request, app, token, **kwargs):
-        response = requests.post(
+        response = get_adapter().get_requests_session().post(
             self.profile_url,
             params={'schema': 'openid',
                     'access_token': token})
@@ -13,9 +13,8 @@ class PersonaTests(TestCase):
 
     @override_settings(SOCIALACCOUNT_PROVIDERS=SOCIALACCOUNT_PROVIDERS)
     def test_login(self):
-        with patch('allauth.socialaccount.providers.persona.views'
-                   '.requests') as requests_mock:
-            requests_mock.post.return_value.json.return_value = {
+        with patch('requests.Session.post') as post_mock:
+            post_mock.return_value.json.return_value = {
                 'status': 'okay',
                 'email': 'persona@example.com'
             }
@@ -3,6 +3,7 @@ import requests
 from django.core.exceptions import ImproperlyConfigured
 
 from allauth.socialaccount import app_settings, providers
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.helpers import (
     complete_social_login,
     render_authentication_error,
@@ -22,9 +23,10 @@ def persona_login(request):
             "add an AUDIENCE item to the "
             "SOCIALACCOUNT_PROVIDERS['persona'] setting.")
 
-    resp = requests.post('https://verifier.login.persona.org/verify',
-                         {'assertion': assertion,
-                          'audience': audience})
+    resp = get_adapter().get_requests_session().post(
+        'https://verifier.login.persona.org/verify',
+        {'assertion': assertion,
+         'audience': audience})
     try:
         resp.raise_for_status()
         extra_data = resp.json()
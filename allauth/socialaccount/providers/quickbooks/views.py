@@ -1,6 +1,6 @@
 import json
-import requests
 
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -36,9 +36,11 @@ class QuickBooksOAuth2Adapter(OAuth2Adapter):
                    }
         QBO_sandbox = self.get_provider().get_settings().get('SANDBOX', False)
         if QBO_sandbox:
-            r = requests.get(self.profile_test, headers=headers)
+            r = get_adapter().get_requests_session().get(
+                self.profile_test, headers=headers)
         else:
-            r = requests.get(self.profile_url, headers=headers)
+            r = get_adapter().get_requests_session().get(
+                self.profile_url, headers=headers)
 #        status_code = r.status_code
         response = json.loads(r.text)
         return response
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -29,7 +28,8 @@ class SalesforceOAuth2Adapter(OAuth2Adapter):
         return '{}/services/oauth2/userinfo'.format(self.base_url)
 
     def complete_login(self, request, app, token, **kwargs):
-        resp = requests.get(self.userinfo_url, params={'oauth_token': token})
+        resp = get_adapter().get_requests_session().get(
+            self.userinfo_url, params={'oauth_token': token})
         resp.raise_for_status()
         extra_data = resp.json()
         return self.get_provider().sociallogin_from_response(request,
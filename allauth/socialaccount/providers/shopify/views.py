@@ -1,10 +1,10 @@
 import re
-import requests
 
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseBadRequest
 
 from allauth.exceptions import ImmediateHttpResponse
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -50,7 +50,7 @@ class ShopifyOAuth2Adapter(OAuth2Adapter):
     def complete_login(self, request, app, token, **kwargs):
         headers = {
             'X-Shopify-Access-Token': '{token}'.format(token=token.token)}
-        response = requests.get(
+        response = get_adapter().get_requests_session().get(
             self.profile_url,
             headers=headers)
         extra_data = response.json()
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -18,10 +17,11 @@ class StackExchangeOAuth2Adapter(OAuth2Adapter):
     def complete_login(self, request, app, token, **kwargs):
         provider = self.get_provider()
         site = provider.get_site()
-        resp = requests.get(self.profile_url,
-                            params={'access_token': token.token,
-                                    'key': app.key,
-                                    'site': site})
+        resp = get_adapter().get_requests_session().get(
+            self.profile_url,
+            params={'access_token': token.token,
+                    'key': app.key,
+                    'site': site})
         extra_data = resp.json()['items'][0]
         return self.get_provider().sociallogin_from_response(request,
                                                              extra_data)
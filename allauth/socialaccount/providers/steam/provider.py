@@ -1,8 +1,7 @@
-import requests
-
-from django.urls import reverse
 from django.utils.http import urlencode
 
+from allauth.socialaccount.adapter import get_adapter
+from allauth.socialaccount.providers.base import reverse_login_url
 from allauth.socialaccount.providers.openid.provider import (
     OpenIDAccount,
     OpenIDProvider,
@@ -34,7 +33,7 @@ def request_steam_account_summary(api_key, steam_id):
     method = "ISteamUser/GetPlayerSummaries/v0002/"
     params = {"key": api_key, "steamids": steam_id}
 
-    resp = requests.get(api_base + method, params)
+    resp = get_adapter().get_requests_session().get(api_base + method, params)
     data = resp.json()
 
     playerlist = data.get("response", {}).get("players", [])
@@ -47,7 +46,7 @@ class SteamOpenIDProvider(OpenIDProvider):
     account_class = SteamAccount
 
     def get_login_url(self, request, **kwargs):
-        url = reverse("steam_login")
+        url = reverse_login_url("steam_login")
         if kwargs:
             url += "?" + urlencode(kwargs)
         return url
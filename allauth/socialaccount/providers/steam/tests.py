@@ -0,0 +1,24 @@
+from django.test.client import RequestFactory
+from django.test.utils import modify_settings
+
+from allauth.socialaccount.providers import ProviderRegistry
+from allauth.socialaccount.providers.openid.utils import DBOpenIDStore
+from allauth.tests import TestCase, patch
+
+from .views import SteamOpenIDLoginView
+
+
+class SteamTests(TestCase):
+
+    @modify_settings(INSTALLED_APPS={
+        'remove': ['allauth.socialaccount.providers.openid']})
+    def test_client_without_openid_app(self):
+        registry = ProviderRegistry()
+        request = RequestFactory().get('/')
+        request.session = {}
+        view = SteamOpenIDLoginView()
+        view.request = request
+        with patch('allauth.socialaccount.providers.registry', registry):
+            client = view.get_client()
+        self.assertFalse('openid' in registry.provider_map)
+        self.assertIsInstance(client.consumer.store, DBOpenIDStore)
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Error
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
@@ -18,7 +17,8 @@ class TwitchOAuth2Adapter(OAuth2Adapter):
 
     def complete_login(self, request, app, token, **kwargs):
         headers = {'Authorization': 'Bearer {}'.format(token.token)}
-        response = requests.get(self.profile_url, headers=headers)
+        response = get_adapter().get_requests_session().get(
+            self.profile_url, headers=headers)
 
         data = response.json()
         if response.status_code >= 400:
@@ -1,5 +1,4 @@
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.client import (
     OAuth2Client,
     OAuth2Error,
@@ -27,10 +26,11 @@ class UntappdOAuth2Client(OAuth2Client):
             params = data
             data = None
         # TODO: Proper exception handling
-        resp = requests.request(self.access_token_method,
-                                url,
-                                params=params,
-                                data=data)
+        resp = get_adapter(self.request).get_requests_session().request(
+            self.access_token_method,
+            url,
+            params=params,
+            data=data)
         access_token = None
         if resp.status_code == 200:
             access_token = resp.json()['response']
@@ -3,8 +3,7 @@ Views for PatreonProvider
 https://www.patreon.com/platform/documentation/oauth
 """
 
-import requests
-
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -21,8 +20,9 @@ class VimeoOAuth2Adapter(OAuth2Adapter):
     profile_url = 'https://api.vimeo.com/me/'
 
     def complete_login(self, request, app, token, **kwargs):
-        resp = requests.get(self.profile_url,
-                            headers={'Authorization': 'Bearer ' + token.token})
+        resp = get_adapter().get_requests_session().get(
+            self.profile_url,
+            headers={'Authorization': 'Bearer ' + token.token})
         extra_data = resp.json()
         return self.get_provider().sociallogin_from_response(request,
                                                              extra_data)
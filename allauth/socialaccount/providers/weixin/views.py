@@ -1,8 +1,7 @@
-import requests
-
 from django.urls import reverse
 
 from allauth.account import app_settings
+from allauth.socialaccount.adapter import get_adapter
 from allauth.socialaccount.providers.oauth2.views import (
     OAuth2Adapter,
     OAuth2CallbackView,
@@ -28,9 +27,10 @@ class WeixinOAuth2Adapter(OAuth2Adapter):
 
     def complete_login(self, request, app, token, **kwargs):
         openid = kwargs.get('response', {}).get('openid')
-        resp = requests.get(self.profile_url,
-                            params={'access_token': token.token,
-                                    'openid': openid})
+        resp = get_adapter().get_requests_session().get(
+            self.profile_url,
+            params={'access_token': token.token,
+                    'openid': openid})
         extra_data = resp.json()
         nickname = extra_data.get('nickname')
         if nickname:
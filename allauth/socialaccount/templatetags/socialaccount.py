@@ -2,6 +2,7 @@ from django import template
 from django.template.defaulttags import token_kwargs
 
 from allauth.socialaccount import providers
+from allauth.socialaccount.models import SocialAccount
 from allauth.utils import get_request_param
 
 
@@ -64,8 +65,8 @@ def providers_media_js(parser, token):
     return ProvidersMediaJSNode()
 
 
-@register.simple_tag
-def get_social_accounts(user):
+@register.simple_tag(takes_context=True)
+def get_social_accounts(context, user):
     """
     {% get_social_accounts user as accounts %}
 
@@ -75,7 +76,8 @@ def get_social_accounts(user):
         {% if accounts %} -- if there is at least one social account
     """
     accounts = {}
-    for account in user.socialaccount_set.all().iterator():
+    for account in SocialAccount.objects.get_for_user(
+            user, context.get('request')):
         providers = accounts.setdefault(account.provider, [])
         providers.append(account)
     return accounts
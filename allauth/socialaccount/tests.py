@@ -1,25 +1,43 @@
+import ast
+import inspect
 import json
 import random
 import warnings
+from datetime import timedelta
+from importlib import import_module
 
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.messages.middleware import MessageMiddleware
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.template import Context, Template
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
-from django.urls import reverse
+from django.urls import clear_url_caches, reverse
+from django.utils import timezone
 
 from ..account import app_settings as account_settings
 from ..account.models import EmailAddress
 from ..account.utils import user_email, user_username
 from ..compat import parse_qs, urlparse
-from ..tests import MockedResponse, TestCase, mocked_response
+from ..tests import Mock, MockedResponse, TestCase, mocked_response, patch
 from ..utils import get_user_model
 from . import providers
+from .adapter import ProviderSession, get_adapter
+from .forms import DisconnectForm
 from .helpers import complete_social_login
-from .models import SocialAccount, SocialApp, SocialLogin
+from .models import (
+    SocialAccount,
+    SocialApp,
+    SocialLogin,
+    SocialToken,
+    socialapp_cache,
+)
+from .providers.base import reverse_login_url
+from .providers.oauth2.tokens import OAuth2TokenManager
 from .views import signup
 
 
@@ -445,6 +463,46 @@ class SocialAccountTests(TestCase):
         self.assertFalse(
             SocialAccount.objects.filter(pk=account.pk).exists())
 
+    def test_disconnect_ajax(self):
+        user = get_user_model().objects.create(username='test')
+        user.set_password('test')
+        user.save()
+        account = SocialAccount.objects.create(
+            uid='123', provider='twitter', user=user)
+        other = SocialAccount.objects.create(
+            uid='456', provider='github', user=user)
+        self.client.login(username='test', password='test')
+        resp = self.client.post(
+            reverse('socialaccount_connections'),
+            {'account': account.pk},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(
+            [a['id'] for a in resp.json()['data']['socialaccounts']],
+            [other.pk])
+
+    def test_social_accounts_shared_per_request(self):
+        user = get_user_model().objects.create(username='test')
+        SocialAccount.objects.create(uid='123', provider='twitter', user=user)
+        SocialAccount.objects.create(uid='456', provider='github', user=user)
+        request = RequestFactory().get('/')
+        request.user = user
+        template = Template(
+            '{% load socialaccount %}'
+            '{% get_social_accounts user as accounts %}'
+            '{% for account in accounts.twitter %}'
+            '{{ account }}:{{ account.get_provider_account }}'
+            '{% endfor %}')
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                template.render(Context({'request': request,
+                                         'user': user})),
+                'test:Twitter')
+            form = DisconnectForm(request=request)
+            self.assertEqual(len(form.accounts), 2)
+            for account in form.accounts:
+                self.assertIs(account.get_provider_account(),
+                              account.get_provider_account())
+
     @override_settings(
         ACCOUNT_EMAIL_REQUIRED=True,
         ACCOUNT_EMAIL_VERIFICATION='mandatory',
@@ -627,3 +685,301 @@ class SocialAccountTests(TestCase):
 
         resp = self.client.get(reverse('socialaccount_signup'))
         self.assertRedirects(resp, reverse('account_login'))
+
+
+@override_settings(SOCIALACCOUNT_APP_CACHE_TIMEOUT=60)
+class SocialAppCacheTests(TestCase):
+
+    def setUp(self):
+        super(SocialAppCacheTests, self).setUp()
+        socialapp_cache.clear()
+        self.app = SocialApp.objects.create(
+            provider='facebook',
+            name='facebook',
+            client_id='app123id',
+            key='123',
+            secret='dummy')
+        self.app.sites.add(Site.objects.get_current())
+
+    def tearDown(self):
+        socialapp_cache.clear()
+        super(SocialAppCacheTests, self).tearDown()
+
+    def test_lookup_is_cached_across_requests(self):
+        factory = RequestFactory()
+        app = SocialApp.objects.get_current('facebook',
+                                            factory.get('/'))
+        self.assertEqual(app.pk, self.app.pk)
+        with self.assertNumQueries(0):
+            app = SocialApp.objects.get_current('facebook',
+                                                factory.get('/'))
+        self.assertEqual(app.client_id, 'app123id')
+
+    def test_save_invalidates(self):
+        SocialApp.objects.get_current('facebook')
+        self.app.client_id = 'changed'
+        self.app.save()
+        app = SocialApp.objects.get_current('facebook')
+        self.assertEqual(app.client_id, 'changed')
+
+    def test_sites_change_invalidates(self):
+        SocialApp.objects.get_current('facebook')
+        self.app.sites.clear()
+        with self.assertRaises(SocialApp.DoesNotExist):
+            SocialApp.objects.get_current('facebook')
+
+    @override_settings(SOCIALACCOUNT_APP_CACHE_ALIAS='default')
+    def test_invalidation_by_other_process(self):
+        SocialApp.objects.get_current('facebook')
+        SocialApp.objects.filter(pk=self.app.pk).update(client_id='changed')
+        # Another process invalidates the shared cache, leaving the local
+        # entries of this process in place.
+        local = dict(socialapp_cache.local)
+        socialapp_cache.clear()
+        socialapp_cache.local.update(local)
+        app = SocialApp.objects.get_current('facebook')
+        self.assertEqual(app.client_id, 'changed')
+
+    @override_settings(SOCIALACCOUNT_APP_CACHE_TIMEOUT=None)
+    def test_disabled(self):
+        SocialApp.objects.get_current('facebook')
+        with self.assertNumQueries(1):
+            SocialApp.objects.get_current('facebook')
+
+
+class RequestsSessionTests(TestCase):
+
+    def test_session_is_shared(self):
+        session = get_adapter().get_requests_session()
+        self.assertIs(get_adapter().get_requests_session(), session)
+
+    def test_default_timeout(self):
+        session = ProviderSession(timeout=3)
+        with patch('requests.Session.request') as request_mock:
+            session.get('https://provider.example.com/me')
+            session.get('https://provider.example.com/me', timeout=10)
+        self.assertEqual(request_mock.call_args_list[0][1]['timeout'], 3)
+        self.assertEqual(request_mock.call_args_list[1][1]['timeout'], 10)
+
+
+class ProviderManifestTests(TestCase):
+
+    def get_urls_kind(self, provider_cls):
+        """
+        Returns the kind of default URL patterns (`'oauth'` or `'oauth2'`)
+        that make up all of the URL patterns of `provider_cls`, if any.
+        Looks at the source of the `urls` module, as its `urlpatterns`
+        depend on the settings in effect when it was (re)loaded.
+        """
+        try:
+            urls = import_module(provider_cls.get_package() + '.urls')
+        except ImportError:
+            return None
+        tree = ast.parse(inspect.getsource(urls))
+        kinds = [
+            node.module.split('.')[-2] for node in tree.body
+            if isinstance(node, ast.ImportFrom) and node.module in (
+                'allauth.socialaccount.providers.oauth.urls',
+                'allauth.socialaccount.providers.oauth2.urls')]
+        assignments = [
+            node for node in tree.body
+            if isinstance(node, (ast.Assign, ast.AugAssign))]
+        if len(kinds) != 1 or len(assignments) != 1:
+            return None
+        value = getattr(assignments[0], 'value', None)
+        if not (isinstance(value, ast.Call) and
+                getattr(value.func, 'id', None) == 'default_urlpatterns'):
+            return None
+        return kinds[0]
+
+    def test_manifest_matches_providers(self):
+        from .providers.manifest import PROVIDERS
+        for provider_cls in providers.registry.get_class_list():
+            package = provider_cls.get_package()
+            if not package.startswith('allauth.socialaccount.providers.'):
+                continue
+            entry = [e for e in PROVIDERS[package] if e[0] == provider_cls.id]
+            self.assertEqual(
+                entry,
+                [(provider_cls.id, provider_cls.name, provider_cls.get_slug(),
+                  self.get_urls_kind(provider_cls))])
+
+
+@override_settings(SOCIALACCOUNT_LAZY_PROVIDERS=True)
+class LazyProviderRegistryTests(TestCase):
+
+    def setUp(self):
+        self.registry = providers.ProviderRegistry()
+
+    def test_providers_not_imported_on_load(self):
+        with patch.object(self.registry, '_import_provider_module') as im:
+            choices = dict(self.registry.as_choices())
+            entries = self.registry.get_entry_list()
+        # Only the apps not listed in the manifest are probed.
+        self.assertNotIn(
+            'allauth.socialaccount.providers.github',
+            [call[0][0] for call in im.call_args_list])
+        self.assertEqual(choices['github'], 'GitHub')
+        self.assertEqual(
+            [entry.id for entry in entries],
+            [entry.id for entry in providers.registry.get_entry_list()])
+
+    def test_provider_imported_on_first_use(self):
+        self.assertNotIn('github', self.registry.provider_map)
+        provider = self.registry.by_id('github')
+        self.assertEqual(provider.name, 'GitHub')
+        self.assertIn('github', self.registry.provider_map)
+
+    def test_entry_replaced_by_class_once_imported(self):
+        self.registry.get_class('github')
+        entries = dict(
+            (entry.id, entry) for entry in self.registry.get_entry_list())
+        self.assertIs(entries['github'], self.registry.provider_map['github'])
+        self.assertIsInstance(
+            entries['gitlab'], providers.ProviderManifestEntry)
+
+    def test_default_urlpatterns_lazy_views(self):
+        from .providers.oauth2.urls import default_urlpatterns
+        entry = providers.ProviderManifestEntry(
+            'allauth.socialaccount.providers.github',
+            'github', 'GitHub', 'github', 'oauth2')
+        login_url = default_urlpatterns(entry)[0].url_patterns[0]
+        with patch('allauth.utils.import_attribute') as import_attribute:
+            self.assertFalse(import_attribute.called)
+            login_url.callback.csrf_exempt
+        import_attribute.assert_called_once_with(
+            'allauth.socialaccount.providers.github.views.oauth2_login')
+
+
+class ProviderInstanceCacheTests(TestCase):
+
+    def test_instances_reused_per_request(self):
+        factory = RequestFactory()
+        request = factory.get('/')
+        provider = providers.registry.by_id('github', request)
+        self.assertIs(providers.registry.by_id('github', request), provider)
+        self.assertIn(provider, providers.registry.get_list(request))
+        self.assertIsNot(
+            providers.registry.by_id('github', factory.get('/')), provider)
+
+    def test_settings_change_invalidates(self):
+        provider = providers.registry.by_id('github')
+        with override_settings(SOCIALACCOUNT_PROVIDERS={
+                'github': {'SCOPE': ['user']}}):
+            self.assertEqual(provider.get_settings(), {'SCOPE': ['user']})
+        self.assertEqual(provider.get_settings(), {})
+
+
+class ReverseLoginURLTests(TestCase):
+
+    def test_cached_per_resolver(self):
+        clear_url_caches()
+        with patch('allauth.socialaccount.providers.base.reverse',
+                   wraps=reverse) as reverse_mock:
+            for i in range(2):
+                self.assertEqual(reverse_login_url('github_login'),
+                                 '/github/login/')
+            self.assertEqual(reverse_mock.call_count, 1)
+            clear_url_caches()
+            self.assertEqual(reverse_login_url('github_login'),
+                             '/github/login/')
+            self.assertEqual(reverse_mock.call_count, 2)
+
+    def test_provider_login_url(self):
+        request = RequestFactory().get('/accounts/login/')
+        request.session = {}
+        template = Template(
+            '{% load socialaccount %}'
+            '{% provider_login_url "github" %}|'
+            '{% provider_login_url "github" process="connect" %}')
+        self.assertEqual(
+            template.render(Context({'request': request})),
+            '/github/login/|/github/login/?process=connect')
+
+
+class OAuth2TokenManagerTests(TestCase):
+
+    def setUp(self):
+        self.user = get_user_model().objects.create(username='test')
+        self.token = self.create_token('github')
+
+    def create_token(self, provider):
+        app = SocialApp.objects.create(
+            provider=provider, name=provider, client_id='app123id',
+            secret='dummy')
+        account = SocialAccount.objects.create(
+            uid='123', provider=provider, user=self.user)
+        return SocialToken.objects.create(
+            app=app, account=account, token='old', token_secret='refresh',
+            expires_at=timezone.now() + timedelta(seconds=30))
+
+    def refreshed_response(self):
+        return MockedResponse(200, json.dumps({
+            'access_token': 'new', 'expires_in': 3600}),
+            {'content-type': 'application/json'})
+
+    def test_get_token_refreshes_expiring_token(self):
+        manager = OAuth2TokenManager(margin=60)
+        with patch('requests.Session.request') as request_mock:
+            request_mock.return_value = self.refreshed_response()
+            token = manager.get_token(self.token)
+            manager.get_token(token)
+        self.assertEqual(request_mock.call_count, 1)
+        data = request_mock.call_args[1]['data']
+        self.assertEqual(data['grant_type'], 'refresh_token')
+        self.assertEqual(data['refresh_token'], 'refresh')
+        token = SocialToken.objects.get(pk=self.token.pk)
+        self.assertEqual(token.token, 'new')
+        self.assertEqual(token.token_secret, 'refresh')
+        self.assertFalse(manager.is_expiring(token))
+
+    def test_refresh_oauth_login_view(self):
+        # Dropbox uses the OAuth URL patterns (`oauth_login`).
+        token = self.create_token('dropbox')
+        with patch('requests.Session.request') as request_mock:
+            request_mock.return_value = self.refreshed_response()
+            OAuth2TokenManager().refresh(token)
+        self.assertEqual(request_mock.call_args[0][1],
+                         'https://api.dropbox.com/oauth2/token')
+        self.assertEqual(
+            SocialToken.objects.get(pk=token.pk).token, 'new')
+
+    def test_expired_lock_not_released(self):
+        manager = OAuth2TokenManager()
+        key = manager.get_lock_key(self.token)
+
+        def refresh_token(token):
+            # The lock timed out and was taken over by someone else.
+            cache.set(key, 'other')
+
+        try:
+            with patch.object(manager, 'refresh_token',
+                              side_effect=refresh_token):
+                manager.refresh(self.token)
+            self.assertEqual(cache.get(key), 'other')
+        finally:
+            cache.delete(key)
+
+    def test_refresh_skipped_when_locked(self):
+        manager = OAuth2TokenManager()
+        manager.lock_timeout = 0
+        cache.add(manager.get_lock_key(self.token), 1)
+        # Refreshed by whoever holds the lock.
+        SocialToken.objects.filter(pk=self.token.pk).update(token='other')
+        try:
+            with patch('requests.Session.request') as request_mock:
+                manager.refresh(self.token)
+        finally:
+            cache.delete(manager.get_lock_key(self.token))
+        request_mock.assert_not_called()
+        self.assertEqual(self.token.token, 'other')
+
+    def test_refresh_command(self):
+        stdout = Mock()
+        with mocked_response(self.refreshed_response()):
+            call_command('socialaccount_refresh_tokens', within=60,
+                         stdout=stdout)
+        self.assertEqual(
+            SocialToken.objects.get(pk=self.token.pk).token, 'new')
+        self.assertTrue(stdout.write.call_args[0][0].startswith(
+            '1/1 refreshed, 0 failed'))
@@ -113,7 +113,9 @@ class ConnectionsView(AjaxCapableProcessFormViewMixin, FormView):
 
     def get_ajax_data(self):
         account_data = []
-        for account in SocialAccount.objects.filter(user=self.request.user):
+        accounts = SocialAccount.objects.get_for_user(self.request.user,
+                                                      self.request)
+        for account in accounts:
             provider_account = account.get_provider_account()
             account_data.append({
                 'id': account.pk,
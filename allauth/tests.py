@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 import json
 import requests
 from datetime import date, datetime
+from decimal import Decimal
 
 from django.core.files.base import ContentFile
 from django.db import models
@@ -12,7 +13,7 @@ from django.views import csrf
 
 from allauth.compat import base36_to_int, int_to_base36
 
-from . import utils
+from . import ratelimit, utils
 
 
 try:
@@ -49,6 +50,7 @@ class mocked_response:
         self.orig_get = requests.get
         self.orig_post = requests.post
         self.orig_request = requests.request
+        self.orig_session_request = requests.Session.request
 
         def mockable_request(f):
             def new_f(*args, **kwargs):
@@ -59,11 +61,13 @@ class mocked_response:
         requests.get = mockable_request(requests.get)
         requests.post = mockable_request(requests.post)
         requests.request = mockable_request(requests.request)
+        requests.Session.request = mockable_request(requests.Session.request)
 
     def __exit__(self, type, value, traceback):
         requests.get = self.orig_get
         requests.post = self.orig_post
         requests.request = self.orig_request
+        requests.Session.request = self.orig_session_request
 
 
 class BasicTests(TestCase):
@@ -158,6 +162,25 @@ class BasicTests(TestCase):
         self.assertEqual(deserialized.bb, b'some binary data')
         self.assertEqual(deserialized.bb_empty, b'')
 
+    def test_serializer_field_plan(self):
+        class SomePlanModel(models.Model):
+            name = models.CharField(max_length=10)
+            d = models.DateField()
+
+        instance = SomePlanModel(name='foo', d=date(2019, 1, 2))
+        instance.extra = (1, {'a': Decimal('1.5')})
+        with patch.object(SomePlanModel._meta, 'get_field') as get_field:
+            serialized = utils.serialize_instance(instance)
+            utils.serialize_instance(instance)
+        get_field.assert_not_called()
+        self.assertEqual(serialized, {
+            'id': None, 'name': 'foo', 'd': '2019-01-02',
+            'extra': [1, {'a': '1.5'}]})
+        self.assertIs(utils._get_field_plan(SomePlanModel),
+                      utils._get_field_plan(SomePlanModel))
+        deserialized = utils.deserialize_instance(SomePlanModel, serialized)
+        self.assertEqual(deserialized.d, date(2019, 1, 2))
+
     def test_build_absolute_uri(self):
         self.assertEqual(
             utils.build_absolute_uri(None, '/foo'),
@@ -187,3 +210,29 @@ class BasicTests(TestCase):
         # Ensure that CSRF failures with this template
         # tag succeed with the expected 403 response
         self.assertEqual(response.status_code, 403)
+
+
+class RateLimitTests(TestCase):
+
+    def test_hit(self):
+        key = 'allauth/tests/ratelimit'
+        ratelimit.clear(key)
+        self.assertFalse(ratelimit.is_exceeded({key: 2}))
+        self.assertEqual(ratelimit.hit(key, 60), 1)
+        self.assertEqual(ratelimit.hit(key, 60), 2)
+        self.assertTrue(ratelimit.is_exceeded({key: 2}))
+        ratelimit.clear(key)
+        self.assertEqual(ratelimit.get_counts([key]), {key: 0})
+
+    def test_fixed_window(self):
+        key = 'allauth/tests/ratelimit'
+        ratelimit.clear(key)
+        with patch('time.time', return_value=1000.0):
+            self.assertEqual(ratelimit.hit(key, 60), 1)
+        with patch('time.time', return_value=1050.0):
+            self.assertEqual(ratelimit.hit(key, 60), 2)
+        # The window is not extended by the second hit.
+        with patch('time.time', return_value=1061.0):
+            self.assertEqual(ratelimit.get_counts([key]), {key: 0})
+            self.assertEqual(ratelimit.hit(key, 60), 1)
+        ratelimit.clear(key)
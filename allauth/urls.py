@@ -14,7 +14,15 @@ if app_settings.SOCIALACCOUNT_ENABLED:
 
 # Provider urlpatterns, as separate attribute (for reusability).
 provider_urlpatterns = []
-for provider in providers.registry.get_list():
+for provider in providers.registry.get_entry_list():
+    if isinstance(provider, providers.ProviderManifestEntry) and provider.urls:
+        # Not imported yet, build the default patterns without importing the
+        # provider.
+        default_urlpatterns = import_module(
+            'allauth.socialaccount.providers.%s.urls' % provider.urls
+        ).default_urlpatterns
+        provider_urlpatterns += default_urlpatterns(provider)
+        continue
     try:
         prov_mod = import_module(provider.get_package() + '.urls')
     except ImportError:
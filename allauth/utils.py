@@ -4,6 +4,7 @@ import json
 import random
 import re
 import string
+import time
 import unicodedata
 from collections import OrderedDict
 
@@ -12,7 +13,7 @@ from django.contrib.sites.models import Site
 from django.core.exceptions import ImproperlyConfigured
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import ValidationError, validate_email
-from django.db.models import FieldDoesNotExist, FileField
+from django.db.models import FileField
 from django.db.models.fields import (
     BinaryField,
     DateField,
@@ -135,7 +136,8 @@ def email_address_exists(email, exclude_user=None):
     emailaddresses = EmailAddress.objects
     if exclude_user:
         emailaddresses = emailaddresses.exclude(user=exclude_user)
-    ret = emailaddresses.filter(email__iexact=email).exists()
+    ret = emailaddresses.filter(
+        **EmailAddress.objects.email_lookup(email)).exists()
     if not ret:
         email_field = account_settings.USER_MODEL_EMAIL_FIELD
         if email_field:
@@ -146,6 +148,27 @@ def email_address_exists(email, exclude_user=None):
     return ret
 
 
+def delete_in_batches(queryset, batch_size=1000, sleep=0):
+    """
+    Deletes the rows matched by `queryset` in batches of (at most)
+    `batch_size` rows, selected by primary key, optionally sleeping `sleep`
+    seconds in between batches. This keeps each `DELETE` (and the locks it
+    takes) small. Returns the number of rows deleted.
+    """
+    manager = queryset.model._default_manager
+    deleted = 0
+    while True:
+        pks = list(queryset.order_by('pk').values_list(
+            'pk', flat=True)[:batch_size])
+        if not pks:
+            break
+        manager.filter(pk__in=pks).delete()
+        deleted += len(pks)
+        if sleep and len(pks) == batch_size:
+            time.sleep(sleep)
+    return deleted
+
+
 def import_attribute(path):
     assert isinstance(path, six.string_types)
     pkg, attr = path.rsplit('.', 1)
@@ -153,6 +176,29 @@ def import_attribute(path):
     return ret
 
 
+class LazyCallable(object):
+    """
+    Wraps the callable at `path`, which is only imported once it is called
+    (or one of its attributes is accessed).
+    """
+    def __init__(self, path):
+        self.path = path
+        self._callable = None
+
+    def _get_callable(self):
+        if self._callable is None:
+            self._callable = import_attribute(self.path)
+        return self._callable
+
+    def __call__(self, *args, **kwargs):
+        return self._get_callable()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._get_callable(), name)
+
+
 def import_callable(path_or_callable):
     if not hasattr(path_or_callable, '__call__'):
         ret = import_attribute(path_or_callable)
@@ -163,6 +209,50 @@ def import_callable(path_or_callable):
 
 SERIALIZED_DB_FIELD_PREFIX = '_db_'
 
+_JSON_NATIVE_TYPES = (
+    (type(None), bool, float) + six.integer_types + six.string_types)
+
+_field_plans = {}
+
+
+def _get_field_plan(model):
+    """
+    Maps the (attribute) names of the concrete fields of the model to the
+    field and the way its value is to be (de)serialized. Computed only
+    once per model class.
+    """
+    plan = _field_plans.get(model)
+    if plan is None:
+        plan = {}
+        for field in model._meta.concrete_fields:
+            if isinstance(field, DateTimeField):
+                kind = 'datetime'
+            elif isinstance(field, TimeField):
+                kind = 'time'
+            elif isinstance(field, DateField):
+                kind = 'date'
+            elif isinstance(field, BinaryField):
+                kind = 'binary'
+            elif isinstance(field, FileField):
+                kind = 'file'
+            else:
+                kind = None
+            plan[field.name] = plan[field.attname] = (field, kind)
+        _field_plans[model] = plan
+    return plan
+
+
+def _to_json_value(value, encoder):
+    if isinstance(value, _JSON_NATIVE_TYPES):
+        return value
+    try:
+        # Dates, times, decimals, UUIDs et al.
+        return encoder.default(value)
+    except TypeError:
+        # Containers, for which a full round trip is needed. Raises
+        # TypeError if the value cannot be serialized at all.
+        return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
+
 
 def serialize_instance(instance):
     """
@@ -172,31 +262,33 @@ def serialize_instance(instance):
     Django serialization, as these are models are not "complete" yet.
     Serialization will start complaining about missing relations et al.
     """
+    plan = _get_field_plan(type(instance))
+    encoder = DjangoJSONEncoder()
     data = {}
     for k, v in instance.__dict__.items():
         if k.startswith('_') or callable(v):
             continue
+        field, kind = plan.get(k, (None, None))
+        if kind == 'binary':
+            v = force_str(base64.b64encode(v))
+        elif kind == 'file':
+            if v and not isinstance(v, six.string_types):
+                v = v.name
         try:
-            field = instance._meta.get_field(k)
-            if isinstance(field, BinaryField):
-                v = force_str(base64.b64encode(v))
-            elif isinstance(field, FileField):
-                if v and not isinstance(v, six.string_types):
-                    v = v.name
-            # Check if the field is serializable. If not, we'll fall back
-            # to serializing the DB values which should cover most use cases.
-            try:
-                json.dumps(v, cls=DjangoJSONEncoder)
-            except TypeError:
-                v = field.get_prep_value(v)
-                k = SERIALIZED_DB_FIELD_PREFIX + k
-        except FieldDoesNotExist:
-            pass
+            v = _to_json_value(v, encoder)
+        except TypeError:
+            if field is None:
+                raise
+            # The value is not serializable, fall back to serializing the
+            # DB value which should cover most use cases.
+            v = _to_json_value(field.get_prep_value(v), encoder)
+            k = SERIALIZED_DB_FIELD_PREFIX + k
         data[k] = v
-    return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+    return data
 
 
 def deserialize_instance(model, data):
+    plan = _get_field_plan(model)
     ret = model()
     for k, v in data.items():
         is_db_value = False
@@ -204,30 +296,27 @@ def deserialize_instance(model, data):
             k = k[len(SERIALIZED_DB_FIELD_PREFIX):]
             is_db_value = True
         if v is not None:
-            try:
-                f = model._meta.get_field(k)
-                if isinstance(f, DateTimeField):
-                    v = dateparse.parse_datetime(v)
-                elif isinstance(f, TimeField):
-                    v = dateparse.parse_time(v)
-                elif isinstance(f, DateField):
-                    v = dateparse.parse_date(v)
-                elif isinstance(f, BinaryField):
-                    v = force_bytes(
-                        base64.b64decode(
-                            force_bytes(v)))
-                elif is_db_value:
-                    try:
-                        # This is quite an ugly hack, but will cover most
-                        # use cases...
-                        v = f.from_db_value(v, None, None, None)
-                    except Exception:
-                        raise ImproperlyConfigured(
-                            "Unable to auto serialize field '{}', custom"
-                            " serialization override required".format(k)
-                        )
-            except FieldDoesNotExist:
-                pass
+            field, kind = plan.get(k, (None, None))
+            if kind == 'datetime':
+                v = dateparse.parse_datetime(v)
+            elif kind == 'time':
+                v = dateparse.parse_time(v)
+            elif kind == 'date':
+                v = dateparse.parse_date(v)
+            elif kind == 'binary':
+                v = force_bytes(
+                    base64.b64decode(
+                        force_bytes(v)))
+            elif is_db_value and field is not None:
+                try:
+                    # This is quite an ugly hack, but will cover most
+                    # use cases...
+                    v = field.from_db_value(v, None, None, None)
+                except Exception:
+                    raise ImproperlyConfigured(
+                        "Unable to auto serialize field '{}', custom"
+                        " serialization override required".format(k)
+                    )
         setattr(ret, k, v)
     return ret
 